@@ -0,0 +1,39 @@
+"""add destination etag versions
+
+Revision ID: 1a6d8c3e9b54
+Revises: e7b3f0a85c21
+Create Date: 2026-02-02 11:18:09.460377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1a6d8c3e9b54"
+down_revision: Union[str, None] = "e7b3f0a85c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "destinations",
+        sa.Column("child_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    # documents carry their etag now; drop the old ones, they are rebuilt on first read
+    op.execute("DELETE FROM destination_documents")
+    op.add_column(
+        "destination_documents",
+        sa.Column("etag", sa.String(length=64), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("destination_documents", "etag")
+    op.drop_column("destinations", "child_version")
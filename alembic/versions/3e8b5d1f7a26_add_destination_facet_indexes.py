@@ -0,0 +1,37 @@
+"""add destination facet indexes
+
+Revision ID: 3e8b5d1f7a26
+Revises: 1a6d8c3e9b54
+Create Date: 2026-02-09 15:22:47.810334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8b5d1f7a26"
+down_revision: Union[str, None] = "1a6d8c3e9b54"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FACET_ARRAY_COLUMNS = ("tags", "suitable_for", "popular_for")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in FACET_ARRAY_COLUMNS:
+        op.create_index(
+            f"ix_destinations_{column}",
+            "destinations",
+            [column],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(FACET_ARRAY_COLUMNS):
+        op.drop_index(f"ix_destinations_{column}", table_name="destinations")
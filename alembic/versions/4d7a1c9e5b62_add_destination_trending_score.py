@@ -0,0 +1,41 @@
+"""add destination trending score
+
+Revision ID: 4d7a1c9e5b62
+Revises: 9c4f2a7e1d83
+Create Date: 2026-02-23 14:05:41.618302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d7a1c9e5b62"
+down_revision: Union[str, None] = "9c4f2a7e1d83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("destinations", sa.Column("trending_score", sa.Float(), server_default="0", nullable=False))
+    op.add_column("destinations", sa.Column("decayed_views", sa.Float(), server_default="0", nullable=False))
+    op.add_column("destinations", sa.Column("ranked_view_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("destinations", sa.Column("ranked_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "ix_destinations_trending_score_id",
+        "destinations",
+        ["trending_score", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_destinations_trending_score_id", table_name="destinations")
+    op.drop_column("destinations", "ranked_at")
+    op.drop_column("destinations", "ranked_view_count")
+    op.drop_column("destinations", "decayed_views")
+    op.drop_column("destinations", "trending_score")
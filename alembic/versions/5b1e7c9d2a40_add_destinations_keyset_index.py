@@ -0,0 +1,32 @@
+"""add destinations keyset index
+
+Revision ID: 5b1e7c9d2a40
+Revises: 03c56b4de1ce
+Create Date: 2026-01-08 10:12:41.553210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e7c9d2a40"
+down_revision: Union[str, None] = "03c56b4de1ce"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_destinations_created_at_id",
+        "destinations",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_destinations_created_at_id", table_name="destinations")
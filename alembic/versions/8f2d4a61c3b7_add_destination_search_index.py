@@ -0,0 +1,78 @@
+"""add destination search index
+
+Revision ID: 8f2d4a61c3b7
+Revises: 5b1e7c9d2a40
+Create Date: 2026-01-12 14:36:05.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2d4a61c3b7"
+down_revision: Union[str, None] = "5b1e7c9d2a40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION destinations_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(array_to_string(NEW.tags, ' '), '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(NEW.region, '') || ' ' || coalesce(NEW.country, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER destinations_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, tags, region, country, description ON destinations
+FOR EACH ROW EXECUTE FUNCTION destinations_search_vector_update()
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "destinations",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+
+    op.execute(SEARCH_VECTOR_FUNCTION)
+    op.execute(SEARCH_VECTOR_TRIGGER)
+
+    # backfill existing rows through the trigger
+    op.execute("UPDATE destinations SET name = name")
+
+    op.create_index(
+        "ix_destinations_search_vector",
+        "destinations",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_destinations_name_trgm",
+        "destinations",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_destinations_name_trgm", table_name="destinations")
+    op.drop_index("ix_destinations_search_vector", table_name="destinations")
+    op.execute("DROP TRIGGER IF EXISTS destinations_search_vector_trigger ON destinations")
+    op.execute("DROP FUNCTION IF EXISTS destinations_search_vector_update()")
+    op.drop_column("destinations", "search_vector")
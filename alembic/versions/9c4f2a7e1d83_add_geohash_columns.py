@@ -0,0 +1,79 @@
+"""add geohash columns
+
+Revision ID: 9c4f2a7e1d83
+Revises: 3e8b5d1f7a26
+Create Date: 2026-02-16 10:47:13.275940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4f2a7e1d83"
+down_revision: Union[str, None] = "3e8b5d1f7a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+GEO_TABLES = ("destinations", "attractions", "accommodations", "restaurants")
+
+GEOHASH_PRECISION = 9
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Standard base32 geohash, as app.utils.geo computed it for this revision"""
+    ranges = [[-180.0, 180.0], [-90.0, 90.0]]  # longitude bits first
+    point = (longitude, latitude)
+    chars = []
+    value = 0
+    for bit in range(precision * 5):
+        axis = bit % 2
+        mid = (ranges[axis][0] + ranges[axis][1]) / 2
+        if point[axis] >= mid:
+            value = (value << 1) | 1
+            ranges[axis][0] = mid
+        else:
+            value <<= 1
+            ranges[axis][1] = mid
+        if bit % 5 == 4:
+            chars.append(BASE32[value])
+            value = 0
+    return "".join(chars)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    for table in GEO_TABLES:
+        op.add_column(
+            table,
+            sa.Column("geohash", sa.String(length=12, collation="C"), nullable=True),
+        )
+
+        # geohash is computed application side, backfill existing rows
+        rows = bind.execute(sa.text(
+            f"SELECT id, latitude, longitude FROM {table} "
+            "WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+        )).all()
+        if rows:
+            bind.execute(
+                sa.text(f"UPDATE {table} SET geohash = :geohash WHERE id = :id"),
+                [
+                    {"id": row.id, "geohash": encode_geohash(float(row.latitude), float(row.longitude))}
+                    for row in rows
+                ],
+            )
+
+        op.create_index(f"ix_{table}_geohash", table, ["geohash"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(GEO_TABLES):
+        op.drop_index(f"ix_{table}_geohash", table_name=table)
+        op.drop_column(table, "geohash")
@@ -0,0 +1,35 @@
+"""add destination slug pattern index
+
+Revision ID: b81e5f3a7c09
+Revises: 4d7a1c9e5b62
+Create Date: 2026-03-02 09:31:18.504127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b81e5f3a7c09"
+down_revision: Union[str, None] = "4d7a1c9e5b62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # LIKE 'prefix%' can only use a btree index with pattern ops under a
+    # non-C collation
+    op.create_index(
+        "ix_destinations_slug_pattern",
+        "destinations",
+        ["slug"],
+        unique=False,
+        postgresql_ops={"slug": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_destinations_slug_pattern", table_name="destinations")
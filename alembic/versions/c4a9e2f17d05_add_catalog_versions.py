@@ -0,0 +1,34 @@
+"""add catalog versions
+
+Revision ID: c4a9e2f17d05
+Revises: 8f2d4a61c3b7
+Create Date: 2026-01-19 09:41:27.306615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e2f17d05"
+down_revision: Union[str, None] = "8f2d4a61c3b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "catalog_versions",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("catalog_versions")
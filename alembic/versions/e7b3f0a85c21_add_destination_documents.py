@@ -0,0 +1,45 @@
+"""add destination documents
+
+Revision ID: e7b3f0a85c21
+Revises: c4a9e2f17d05
+Create Date: 2026-01-26 16:05:52.741930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3f0a85c21"
+down_revision: Union[str, None] = "c4a9e2f17d05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # documents of existing destinations are built lazily on first read
+    op.create_table(
+        "destination_documents",
+        sa.Column("destination_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("slug", sa.String(length=255), nullable=False),
+        sa.Column("document", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["destination_id"], ["destinations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("destination_id"),
+    )
+    op.create_index(
+        "ix_destination_documents_slug",
+        "destination_documents",
+        ["slug"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_destination_documents_slug", table_name="destination_documents")
+    op.drop_table("destination_documents")
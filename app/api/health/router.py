@@ -3,9 +3,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.base.schema import DataResponse
 from app.db.session import get_async_session
 from app.api.health.schema import HealthCheckResponse
 from app.core.config import get_settings
+from app.utils.cache import cache_registry
 
 router = APIRouter()
 
@@ -53,3 +55,16 @@ async def health_check(
         timestamp=datetime.now(timezone.utc).isoformat(),
         services=services,
     )
+
+
+@router.get(
+    "/cache",
+    response_model=DataResponse,
+    summary="Cache Statistics",
+    description="Hit/miss counters of the in-process and redis caches of this worker",
+)
+async def cache_stats():
+    return DataResponse(
+        data={name: cache.stats() for name, cache in cache_registry.items()},
+        message="Cache statistics fetched successfully.",
+    )
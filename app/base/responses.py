@@ -0,0 +1,34 @@
+import json
+from typing import Dict, Optional
+
+from starlette.responses import Response
+
+
+def raw_data_response(
+    data: bytes,
+    message: str = "Success",
+    success: bool = True,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    DataResponse envelope around an already serialized JSON payload,
+    so cached/pre-built payloads are sent without re-encoding.
+    """
+    body = b"".join((
+        b'{"success":', b"true" if success else b"false",
+        b',"message":', json.dumps(message).encode(),
+        b',"data":', data,
+        b"}",
+    ))
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """304 for a conditional GET whose If-None-Match matched"""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Optional, List
+from typing import Generic, TypeVar, Optional, List, Dict
 from pydantic import BaseModel, Field, model_validator
 
 DataT = TypeVar("DataT")
@@ -16,35 +16,49 @@ class DataResponse(BaseResponse, Generic[DataT]):
 
 
 class ListMeta(BaseModel):
-    total: int = Field(default=0, description="Total count of items")
+    total: Optional[int] = Field(default=None, description="Total count of items (omitted when not counted)")
     page: int = Field(default=1, ge=1, description="Current page number")
     page_size: int = Field(default=50, ge=1, le=100, description="Items per page")
-    total_pages: int = Field(default=0, description="Total number of pages")
+    total_pages: Optional[int] = Field(default=None, description="Total number of pages")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page, if any")
+    facets: Optional[Dict[str, Dict[str, int]]] = Field(default=None, description="Per-value counts of each facet, when requested")
 
 class ListResponse(BaseResponse, Generic[DataT]):
     data: List[DataT] = Field(default_factory=list)
 
     # incoming fields (not exposed)
-    total: int = Field(exclude=True)
+    total: Optional[int] = Field(default=None, exclude=True)
     page: int = Field(exclude=True)
     page_size: int = Field(exclude=True)
+    next_cursor: Optional[str] = Field(default=None, exclude=True)
+    facets: Optional[Dict[str, Dict[str, int]]] = Field(default=None, exclude=True)
 
     # outgoing meta
     meta: ListMeta | None = None
 
     @model_validator(mode="after")
     def build_meta(self):
-        total_pages = (
-            (self.total + self.page_size - 1) // self.page_size
-            if self.page_size > 0
-            else 0
-        )
+        """
+        Derive meta from the incoming fields. Runs once, when the route
+        builds the response: FastAPI does not re-validate a returned
+        instance, and validating ListMeta keeps its page/page_size bounds
+        while costing no more than model_construct.
+        """
+        total_pages = None
+        if self.total is not None:
+            total_pages = (
+                (self.total + self.page_size - 1) // self.page_size
+                if self.page_size > 0
+                else 0
+            )
 
         self.meta = ListMeta(
             total=self.total,
             page=self.page,
             page_size=self.page_size,
             total_pages=total_pages,
+            next_cursor=self.next_cursor,
+            facets=self.facets,
         )
         return self
 
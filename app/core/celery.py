@@ -7,9 +7,20 @@ celery_app = Celery(
     "worker",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=[],
+    include=["destination.tasks"],
 )
 
 celery_app.conf.task_routes = {
     "tasks.*": {"queue": "default"},
-}
\ No newline at end of file
+}
+
+celery_app.conf.beat_schedule = {
+    "flush-destination-view-counts": {
+        "task": "tasks.destination.flush_view_counts",
+        "schedule": settings.view_count_flush_interval,
+    },
+    "rank-destinations": {
+        "task": "tasks.destination.rank_destinations",
+        "schedule": settings.trending_rank_interval,
+    },
+}
@@ -50,7 +50,52 @@ class Settings(BaseSettings):
     redis_port: int = Field(default=6379, ge=1, le=65535)
     redis_db: int = Field(default=0, ge=0, le=15)
     redis_password: str | None = None
-    
+    redis_socket_timeout: float = Field(default=0.5, gt=0)
+
+    # Cache
+    destination_cache_local_size: int = Field(default=512, ge=0)
+    destination_cache_local_ttl: int = Field(default=30, ge=1, description="Seconds")
+    destination_cache_redis_ttl: int = Field(default=600, ge=1, description="Seconds")
+    destination_missing_slug_cache_size: int = Field(default=4096, ge=0)
+    destination_missing_slug_ttl: int = Field(default=60, ge=1, description="Seconds an unknown slug is remembered")
+    cache_redis_retry_after: int = Field(default=30, ge=1, description="Seconds to skip redis after a failure")
+    reference_registry_check_interval: int = Field(default=30, ge=1, description="Seconds between version checks")
+
+    # Lists
+    list_count_strategy: Literal["exact", "estimated", "none"] = Field(
+        default="exact",
+        description="Default way list endpoints compute meta.total",
+    )
+    list_count_cache_size: int = Field(default=1024, ge=0)
+    list_count_cache_ttl: int = Field(default=30, ge=1, description="Seconds an exact total is reused")
+
+    # Geo
+    geo_max_radius_m: int = Field(default=50_000, ge=1, description="Largest radius accepted by nearby queries")
+    attraction_geofence_max_radius_m: int = Field(default=5_000, ge=1, description="Largest radius accepted by geofence checks")
+    attraction_index_check_interval: int = Field(default=30, ge=1, description="Seconds between attraction index version checks")
+
+    # Destination details
+    destination_details_engine: Literal["rows", "orm", "json"] = Field(
+        default="rows",
+        description="Build details documents from Core rows, through the ORM or in a single json_agg statement",
+    )
+
+    # Bulk import
+    destination_import_chunk_size: int = Field(default=500, ge=1, le=5000, description="Records per import transaction")
+
+    # Export
+    destination_export_batch_size: int = Field(default=200, ge=1, le=5000, description="Rows fetched per server-side cursor round trip")
+
+    # View counts
+    view_count_flush_interval: int = Field(default=30, ge=1, description="Seconds between view count flushes")
+    view_count_flush_batch: int = Field(default=1000, ge=1, description="Destinations per flush UPDATE")
+
+    # Trending
+    trending_rank_interval: int = Field(default=600, ge=1, description="Seconds between ranking runs")
+    trending_half_life_hours: float = Field(default=72, gt=0, description="Hours for a view's weight to halve")
+    trending_featured_weight: float = Field(default=50, ge=0, description="Score added to featured destinations")
+    trending_recommended_weight: float = Field(default=5, ge=0, description="Score per recommended attraction or dish")
+
     # Celery
     celery_broker_url: str | None = None
     celery_result_backend: str | None = None
@@ -0,0 +1,62 @@
+from typing import Optional
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+
+settings = get_settings()
+logger = setup_logging()
+
+_redis_client: Optional[Redis] = None
+_sync_redis_client: Optional[SyncRedis] = None
+
+
+def get_redis() -> Redis:
+    """
+    Shared async Redis client (lazily created, pooled).
+
+    Usage:
+        redis = get_redis()
+        await redis.get("key")
+    """
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = Redis.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+
+    return _redis_client
+
+
+def get_sync_redis() -> SyncRedis:
+    """Shared sync Redis client, for Celery tasks"""
+    global _sync_redis_client
+
+    if _sync_redis_client is None:
+        _sync_redis_client = SyncRedis.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+
+    return _sync_redis_client
+
+
+async def close_redis() -> None:
+    """Close redis connections gracefully"""
+    global _redis_client
+
+    if _redis_client is None:
+        return
+
+    try:
+        await _redis_client.aclose()
+        logger.info("Redis connections closed")
+    except Exception as e:
+        logger.error(f"Error closing redis connections: {e}")
+    finally:
+        _redis_client = None
@@ -0,0 +1,82 @@
+from typing import Hashable, Literal, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+
+CountStrategy = Literal["exact", "estimated", "none"]
+
+# exact totals per (list, catalog version, filter), so paging through a list
+# does not pay a second full query on every page
+count_cache = TTLCache(
+    "list:counts",
+    maxsize=settings.list_count_cache_size,
+    ttl=settings.list_count_cache_ttl,
+)
+
+
+async def count_rows(
+    db: AsyncSession,
+    stmt: Select,
+    strategy: Optional[CountStrategy] = None,
+    cache_key: Optional[Hashable] = None,
+) -> Optional[int]:
+    """
+    Total number of rows `stmt` returns, according to `strategy`:
+
+    - exact: count(*) over the filtered statement, cached under `cache_key`
+      for `list_count_cache_ttl` seconds; the key should include the
+      catalog version writers bump, so a write is never answered from cache
+    - estimated: the planner's row estimate for the statement, no scan
+    - none: not counted, returns None
+
+    `stmt` should select a narrow column (e.g. the primary key) with the
+    list filters applied and no ordering or paging.
+    """
+    strategy = strategy or settings.list_count_strategy
+
+    if strategy == "none":
+        return None
+
+    if strategy == "estimated":
+        return await estimate_rows(db, stmt)
+
+    if cache_key is not None:
+        total = count_cache.get(cache_key)
+        if total is not None:
+            return total
+
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    if cache_key is not None:
+        count_cache.set(cache_key, total)
+
+    return total
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, compiled and bound like the statement itself"""
+    inherit_cache = False
+
+    def __init__(self, stmt: Select):
+        self.stmt = stmt
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    # expanding IN lists, bind processors (enums, arrays) and parameter
+    # positions are left to the statement's own compilation
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+async def estimate_rows(db: AsyncSession, stmt: Select) -> int:
+    """Planner row estimate for `stmt` (EXPLAIN, the query is not run)"""
+    plan = await db.scalar(Explain(stmt))
+    return int(plan[0]["Plan"]["Plan Rows"])
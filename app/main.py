@@ -3,12 +3,15 @@ from fastapi import FastAPI
 
 from app.core.config import get_settings
 from app.core.logging import setup_logging
-from app.db.session import init_db, close_db
+from app.db.session import init_db, close_db, AsyncSessionLocal
+from app.core.redis import close_redis
 from app.middleware import (
     register_middlewares, 
     register_exception_handlers
 )
 from app.api.router import api_router
+from destination.helpers.reference_registry import reference_registry
+from destination.helpers.geo_index import attraction_geo_index
 
 # Initialize logger
 logger = setup_logging()
@@ -21,12 +24,27 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up application...")
     await init_db()
     logger.info("Database initialized successfully")
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await reference_registry.load(db)
+    except Exception as e:
+        # the registry loads lazily on first use instead
+        logger.warning(f"Reference registry preload failed: {e}")
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await attraction_geo_index.load(db)
+    except Exception as e:
+        # the index loads lazily on the first geofence check instead
+        logger.warning(f"Attraction geo index preload failed: {e}")
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
     await close_db()
+    await close_redis()
     logger.info("Application shutdown complete")
 
 
@@ -0,0 +1,179 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.redis import get_redis
+
+settings = get_settings()
+logger = setup_logging()
+
+# name -> cache, so the health endpoint can report every cache's counters
+cache_registry: Dict[str, Any] = {}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    In-process LRU cache with a per-entry time to live.
+
+    Not thread-safe; meant to be used from the event loop only.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float, register: bool = True):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if register:
+            cache_registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class TieredCache:
+    """
+    Read-through byte cache: in-process TTLCache in front of Redis.
+
+    Redis failures are logged and treated as misses; after a failure redis is
+    skipped for `cache_redis_retry_after` seconds so a dead redis does not add
+    a socket timeout to every request. Other processes keep a local copy for at
+    most `local_ttl` seconds after an invalidation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        local_size: int,
+        local_ttl: float,
+        redis_ttl: int,
+    ):
+        self.name = name
+        self.redis_ttl = redis_ttl
+        self.local = TTLCache(f"{name}:local", local_size, local_ttl, register=False)
+        cache_registry[name] = self
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+        self._redis_down_until = 0.0
+
+    def _key(self, key: str) -> str:
+        return f"cache:{self.name}:{key}"
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, action: str, e: Exception) -> None:
+        self.redis_errors += 1
+        self._redis_down_until = time.monotonic() + settings.cache_redis_retry_after
+        logger.warning(f"Cache {self.name}: redis {action} failed: {e}")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = self.local.get(key)
+        if value is not None:
+            self.local_hits += 1
+            return value
+
+        if self._redis_available():
+            try:
+                value = await get_redis().get(self._key(key))
+            except (RedisError, OSError) as e:
+                self._redis_failed("get", e)
+                value = None
+
+            if value is not None:
+                self.redis_hits += 1
+                self.local.set(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        self.local.set(key, value)
+
+        if not self._redis_available():
+            return
+
+        try:
+            await get_redis().set(self._key(key), value, ex=self.redis_ttl)
+        except (RedisError, OSError) as e:
+            self._redis_failed("set", e)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        for key in keys:
+            self.local.delete(key)
+
+        # deletes are attempted even while redis is marked down, a stale
+        # redis entry would outlive the local one by redis_ttl
+        try:
+            await get_redis().delete(*[self._key(key) for key in keys])
+        except (RedisError, OSError) as e:
+            self._redis_failed("delete", e)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else None,
+            "redis_errors": self.redis_errors,
+            "local_size": len(self.local),
+            "local_maxsize": self.local.maxsize,
+            "local_ttl": self.local.ttl,
+            "redis_ttl": self.redis_ttl,
+        }
@@ -0,0 +1,29 @@
+import json
+import base64
+from typing import Any, List
+
+from app.core.exceptions import BadRequestError
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key values of the last row of a page into an opaque cursor
+    """
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode an opaque cursor back into its sort key values
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise BadRequestError("Invalid pagination cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise BadRequestError("Invalid pagination cursor")
+
+    return values
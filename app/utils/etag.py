@@ -0,0 +1,34 @@
+import hashlib
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong entity tag derived from the given version parts"""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def weak_etag(etag: str) -> str:
+    """
+    Weak form of an entity tag, for bodies that can change between versions
+    without being a different representation (e.g. live counters)
+    """
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match evaluation (RFC 9110 weak comparison, as required for GET)
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
@@ -0,0 +1,136 @@
+import math
+from typing import List, Optional, Tuple
+
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE = 111_320.0
+
+GEOHASH_PRECISION = 9  # ~4.8m x 4.8m cells
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_INDEX = {char: i for i, char in enumerate(_BASE32)}
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Standard base32 geohash of a point"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if longitude >= mid:
+                value = (value << 1) | 1
+                lng_range[0] = mid
+            else:
+                value <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                value = (value << 1) | 1
+                lat_range[0] = mid
+            else:
+                value <<= 1
+                lat_range[1] = mid
+
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+
+    return "".join(chars)
+
+
+def decode_geohash(geohash: str) -> Tuple[float, float, float, float]:
+    """(latitude, longitude, lat_error, lng_error) of a geohash cell centre"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for char in geohash:
+        value = _BASE32_INDEX[char]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            target = lng_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            target[1 - bit] = mid
+            even = not even
+
+    return (
+        (lat_range[0] + lat_range[1]) / 2,
+        (lng_range[0] + lng_range[1]) / 2,
+        (lat_range[1] - lat_range[0]) / 2,
+        (lng_range[1] - lng_range[0]) / 2,
+    )
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """(lat_degrees, lng_degrees) covered by a geohash cell of `precision`"""
+    bits = precision * 5
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def precision_for_radius(latitude: float, radius_m: float) -> int:
+    """
+    Longest geohash whose cells are at least `radius_m` on each side around
+    `latitude`, so the 3x3 block of cells around a point covers the circle.
+    """
+    # the narrowest cell width inside the circle is on its pole-ward edge
+    edge = min(90.0, abs(latitude) + radius_m / METERS_PER_DEGREE)
+    cos_lat = math.cos(math.radians(edge))
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lng_deg = cell_size(precision)
+        if lat_deg * METERS_PER_DEGREE >= radius_m and lng_deg * METERS_PER_DEGREE * cos_lat >= radius_m:
+            return precision
+
+    return 1
+
+
+def neighbourhood(geohash: str) -> List[str]:
+    """The cell itself and its (up to) eight neighbours, de-duplicated"""
+    latitude, longitude, lat_err, lng_err = decode_geohash(geohash)
+    precision = len(geohash)
+    cells = []
+
+    for d_lat in (-1, 0, 1):
+        lat = latitude + d_lat * lat_err * 2
+        if not -90.0 <= lat <= 90.0:
+            continue
+        for d_lng in (-1, 0, 1):
+            lng = longitude + d_lng * lng_err * 2
+            lng = (lng + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(lat, lng, precision)
+            if cell not in cells:
+                cells.append(cell)
+
+    return cells
+
+
+def covering_cells(latitude: float, longitude: float, radius_m: float) -> List[str]:
+    """Geohash prefixes whose union covers the circle around the point"""
+    precision = precision_for_radius(latitude, radius_m)
+    return neighbourhood(encode_geohash(latitude, longitude, precision))
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in metres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def point_geohash(latitude, longitude) -> Optional[str]:
+    """Geohash for possibly missing (None / Decimal / str) coordinates"""
+    if latitude is None or longitude is None:
+        return None
+    return encode_geohash(float(latitude), float(longitude))
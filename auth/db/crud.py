@@ -2,7 +2,9 @@ from uuid import UUID
 from typing import List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
+
+from app.db.counting import CountStrategy, count_rows
 
 from auth.db.models import User
 from auth.schema import UserSchema, UserBasicPrivateDetailsSchema
@@ -15,13 +17,15 @@ class UserRepository:
         self,
         page: int, 
         page_size: int, 
-        search_str: Optional[str] = None
-    ) -> Tuple[List[UserBasicPrivateDetailsSchema], int]:
+        search_str: Optional[str] = None,
+        count: Optional[CountStrategy] = None,
+    ) -> Tuple[List[UserBasicPrivateDetailsSchema], Optional[int]]:
         """Get a list of users with pagination and search"""
-        stmt = select(User)
+        filters = []
         if search_str:
-            stmt = stmt.where(User.email.contains(search_str))
-            
+            filters.append(User.email.contains(search_str))
+
+        stmt = select(User).where(*filters)
         stmt = stmt.offset((page - 1) * page_size).limit(page_size)
         result = await self.db.execute(stmt)
 
@@ -31,11 +35,12 @@ class UserRepository:
             for user in users
         ]
 
-        count_stmt = select(func.count(User.user_id))
-        if search_str:
-            count_stmt = count_stmt.where(User.email.contains(search_str))
-
-        total_items = (await self.db.execute(count_stmt)).scalar_one()
+        total_items = await count_rows(
+            self.db,
+            select(User.user_id).where(*filters),
+            count,
+            cache_key=("users", search_str),
+        )
 
         return user_schemas, total_items
 
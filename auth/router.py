@@ -3,6 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Body, Cookie, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.base.schema import DataResponse, ListResponse
+from app.db.counting import CountStrategy
 
 from auth.helpers.dependencies import get_current_user
 
@@ -106,13 +107,15 @@ async def get_user_list(
     page: int = Query(..., ge=1),
     page_size: int = Query(..., ge=1, le=1000),
     search_str: Optional[str] = None,
+    count: Optional[CountStrategy] = Query(None, description="How meta.total is computed: exact, estimated or none"),
     service: AdminUserService = Depends(get_admin_user_service),
     # user_id: UUID = Depends(get_current_user)
 ):
     user_list, total_items = await service.user_list(
         page=page, 
         page_size=page_size, 
-        search_str=search_str
+        search_str=search_str,
+        count=count,
     )
     return ListResponse(
         success=True,
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Optional, List
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -96,12 +96,13 @@ class AdminUserService:
         self.db = db
         self.user_repo = UserRepository(db) 
 
-    async def user_list(self, page, page_size, search_str):
+    async def user_list(self, page, page_size, search_str, count=None):
         """Get user information by email"""
         return await self.user_repo.get_list(
             page=page, 
             page_size=page_size, 
-            search_str=search_str
+            search_str=search_str,
+            count=count,
         )
         
         
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Per-entity cost of turning loaded rows into DestinationFullDetails.
+
+    python -m benchmarks.details_conversion [--attractions 400] [--iterations 20]
+
+Compares the two Python-side rebuild engines on the same data, without a
+database:
+
+- orm: mapped instances validated through `from_attributes`, which reads
+  every column and relationship through SQLAlchemy's instrumented
+  attributes (what the "orm" engine does after loading the graph).
+- rows: result tuples labelled by the statements in details_rows, nested
+  into dicts by `_build` and validated as plain dicts (the "rows" engine).
+
+Both start from already fetched values (Decimal coordinates, enum members,
+datetimes), so the numbers exclude the round trips and driver decoding.
+"""
+import time
+import argparse
+from uuid import uuid4
+from typing import get_args
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+from sqlalchemy.engine.result import SimpleResultMetaData
+
+from benchmarks.response_encoding import build_details
+from destination.db.models import Destination
+from destination.db.details_rows import (
+    DETAILS_PREFIX,
+    COLLECTIONS,
+    _shape,
+    _build,
+    _destinations,
+    _collections,
+    _attraction_images,
+)
+from destination.schemas import DestinationFullDetails
+
+
+def _orm(model, data: dict):
+    """Transient mapped instance of `model` (and its relationships) from a details dict"""
+    mapper = inspect(model)
+    values = {}
+    for name, value in data.items():
+        if name in mapper.relationships:
+            target = mapper.relationships[name].mapper.class_
+            if isinstance(value, list):
+                value = [_orm(target, item) for item in value]
+            elif value is not None:
+                value = _orm(target, value)
+        elif name not in mapper.columns:
+            continue
+        values[name] = value
+    return model(**values)
+
+
+def _rows(stmt, items: list, parent_key: str, prefix: str = "") -> tuple:
+    """Result rows `stmt` would return for `items`, and the nesting plan of its labels"""
+    keys = list(stmt.selected_columns.keys())
+    metadata = SimpleResultMetaData(keys)
+    processors = [None] * len(keys)
+
+    def value(item: dict, label: str):
+        if label == parent_key:
+            return uuid4()
+        for part in label.split("."):
+            item = item.get(part) if item is not None else None
+        return item
+
+    rows = [
+        Row(metadata, processors, metadata._key_to_index, tuple(value(item, key) for key in keys))
+        for item in items
+    ]
+    return rows, _shape(keys, prefix)
+
+
+def _measure(convert, iterations: int) -> float:
+    convert()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        convert()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attractions", type=int, default=400)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    details = build_details(args.attractions).model_dump()
+    destination = _orm(Destination, details)
+    statements = _collections([])
+
+    cases = {}
+
+    scalars = {name: value for name, value in details.items() if name not in COLLECTIONS}
+    childless = _orm(Destination, {**scalars, **{key: [] for key in COLLECTIONS}})
+    [destination_row], destination_shape = _rows(_destinations([]), [{"details": scalars}], "id", DETAILS_PREFIX)
+    cases["destination"] = (
+        1,
+        lambda: DestinationFullDetails.model_validate(childless),
+        lambda: DestinationFullDetails.model_validate({**_build(destination_row, destination_shape), **{key: [] for key in COLLECTIONS}}),
+    )
+
+    for key in COLLECTIONS:
+        schema = get_args(DestinationFullDetails.model_fields[key].annotation)[0]
+        instances = getattr(destination, key)
+        rows, shape = _rows(statements[key], details[key], "destination_id")
+
+        if key == "attractions":
+            image_rows = [_rows(_attraction_images([]), item["images"], "attraction_id") for item in details[key]]
+
+            def build(rows=rows, shape=shape, image_rows=image_rows):
+                items = []
+                for row, (images, image_shape) in zip(rows, image_rows):
+                    item = _build(row, shape)
+                    item["images"] = [_build(image, image_shape) for image in images]
+                    items.append(item)
+                return items
+        else:
+            def build(rows=rows, shape=shape):
+                return [_build(row, shape) for row in rows]
+
+        cases[key] = (
+            len(instances),
+            lambda schema=schema, instances=instances: [schema.model_validate(item) for item in instances],
+            lambda schema=schema, build=build: [schema.model_validate(item) for item in build()],
+        )
+
+    print(f"{'entity':<24}{'count':>7}{'orm us/ea':>12}{'rows us/ea':>12}{'speedup':>10}")
+    totals = [0.0, 0.0]
+    for name, (count, orm, rows) in cases.items():
+        if not count:
+            continue
+        before = _measure(orm, args.iterations)
+        after = _measure(rows, args.iterations)
+        if name != "destination":
+            totals[0] += before
+            totals[1] += after
+        print(f"{name:<24}{count:>7}{before / count * 1e6:>12.1f}{after / count * 1e6:>12.1f}{before / after:>9.1f}x")
+
+    print(f"{'children total (ms)':<31}{totals[0] * 1e3:>12.2f}{totals[1] * 1e3:>12.2f}{totals[0] / totals[1]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Response encoding throughput for DestinationFullDetails payloads.
+
+    python -m benchmarks.response_encoding [--attractions 30] [--iterations 2000]
+
+Compares the ways a details payload can reach the wire:
+
+- fastapi: what FastAPI (>= 0.130) does for a route with response_model and
+  no custom response_class. The returned envelope instance is not
+  re-validated and is dumped straight to JSON bytes by pydantic-core.
+- jsonable_encoder: the pre-0.130 path, also taken by any route or app that
+  sets a custom response_class. It builds a Python dict and runs json.dumps.
+- orjson: model_dump(mode="json") + orjson.dumps, if orjson is installed.
+- raw: raw_data_response around the materialized document bytes, as the
+  details route sends them.
+"""
+import json
+import time
+import argparse
+from uuid import uuid4
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.base.schema import DataResponse
+from app.base.responses import raw_data_response
+from destination.schemas import DestinationFullDetails
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _ref() -> dict:
+    return {"id": uuid4(), "name": "Reference", "description": "Reference type"}
+
+
+def build_details(attractions: int) -> DestinationFullDetails:
+    now = datetime.now(timezone.utc)
+    return DestinationFullDetails.model_validate({
+        "slug": "coxs-bazar",
+        "name": "Cox's Bazar",
+        "description": "The longest natural sea beach in the world. " * 20,
+        "tags": ["beach", "sea", "family"],
+        "best_time": "November - March",
+        "cost_level": "Medium",
+        "avg_duration": "3 days",
+        "suitable_for": ["family", "couples"],
+        "popular_for": ["beach", "seafood"],
+        "country": "Bangladesh",
+        "region": "Chattogram",
+        "longitude": "91.9760000",
+        "latitude": "21.4272000",
+        "timezone": "Asia/Dhaka",
+        "weather": "Tropical",
+        "peak_season": "Winter",
+        "festivals": "Beach carnival",
+        "languages": ["Bangla"],
+        "payment_methods": ["cash", "card"],
+        "safety_tips": "Swim between the flags.",
+        "customs": "Dress modestly.",
+        "how_to_reach": "Fly or take the bus from Dhaka.",
+        "is_active": True,
+        "is_featured": True,
+        "view_count": 1024,
+        "created_at": now,
+        "updated_at": now,
+        "images": [{"image_url": f"https://res.cloudinary.com/x/{i}.jpg", "alt_text": "Beach"} for i in range(10)],
+        "attractions": [
+            {
+                "id": uuid4(),
+                "name": f"Attraction {i}",
+                "description": "A place worth the visit. " * 8,
+                "tag": "Nature",
+                "is_recommended": i % 3 == 0,
+                "region": "Chattogram",
+                "available_transports": ["bus", "rickshaw"],
+                "longitude": "91.9760000",
+                "latitude": "21.4272000",
+                "images": [{"id": uuid4(), "image_url": f"https://res.cloudinary.com/x/a{i}.jpg"}] * 3,
+            }
+            for i in range(attractions)
+        ],
+        "transportation_options": [{"id": uuid4(), "price_range": "100 BDT", "transport_ref": _ref()} for _ in range(5)],
+        "signature_dishes": [
+            {"id": uuid4(), "name": "Rupchanda fry", "tags": ["fish"], "dietary_info": ["halal"]} for _ in range(8)
+        ],
+        "accommodation_types": [{"id": uuid4(), "price_range": "2,000 BDT", "type_ref": _ref()} for _ in range(4)],
+        "accommodations": [
+            {
+                "id": uuid4(),
+                "name": f"Hotel {i}",
+                "price_range": "5,000 BDT",
+                "rating": "4.5",
+                "longitude": "91.9760000",
+                "latitude": "21.4272000",
+                "accommodation_type": {"id": uuid4(), "price_range": "2,000 BDT", "type_ref": _ref()},
+            }
+            for i in range(20)
+        ],
+        "activities": [{"id": uuid4(), "activity_ref": _ref()} for _ in range(10)],
+    })
+
+
+def _measure(encode, iterations: int) -> tuple:
+    size = len(encode())
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encode()
+    per_call = (time.perf_counter() - start) / iterations
+    return per_call, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attractions", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    details = build_details(args.attractions)
+    document = details.model_dump_json().encode()
+    envelope = DataResponse(success=True, data=details, message="Destination details fetched successfully!")
+    adapter = TypeAdapter(DataResponse)
+
+    encoders = {
+        "fastapi": lambda: adapter.dump_json(adapter.validate_python(envelope)),
+        "jsonable_encoder": lambda: json.dumps(jsonable_encoder(envelope)).encode(),
+        "raw": lambda: raw_data_response(document, message=envelope.message).body,
+    }
+    if orjson is not None:
+        encoders["orjson"] = lambda: orjson.dumps(envelope.model_dump(mode="json"))
+
+    print(f"{'encoder':<18}{'bytes':>10}{'us/op':>12}{'MB/s':>10}")
+    for name, encode in encoders.items():
+        # the stdlib path is an order of magnitude slower, keep its run short
+        iterations = args.iterations // 10 if name == "jsonable_encoder" else args.iterations
+        per_call, size = _measure(encode, max(iterations, 1))
+        print(f"{name:<18}{size:>10}{per_call * 1e6:>12.1f}{size / per_call / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
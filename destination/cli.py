@@ -0,0 +1,80 @@
+"""
+Destination management commands.
+
+    python -m destination.cli import destinations.ndjson [--chunk-size 500]
+    python -m destination.cli export destinations.ndjson [--format ndjson|csv] [--details]
+"""
+import sys
+import json
+import asyncio
+import argparse
+from typing import AsyncIterator, Optional
+
+from app.db.session import AsyncSessionLocal, close_db
+from destination.services import DestinationService
+from destination.schemas import DestinationExportFormat
+
+
+async def _file_lines(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        for line in file:
+            yield line
+
+
+async def import_file(path: str, chunk_size: Optional[int] = None) -> int:
+    """Import an NDJSON file, failed records are written to stderr as NDJSON"""
+    try:
+        async with AsyncSessionLocal() as db:
+            summary = await DestinationService(db).import_destinations(_file_lines(path), chunk_size)
+    finally:
+        await close_db()
+
+    for result in summary["results"]:
+        if result["status"] == "failed":
+            print(json.dumps(result), file=sys.stderr)
+
+    print(f"Imported {summary['created']} destinations, {summary['failed']} failed")
+    return 1 if summary["failed"] else 0
+
+
+async def export_file(
+    path: str,
+    export_format: DestinationExportFormat = "ndjson",
+    include_details: bool = False,
+) -> int:
+    """Export the catalog to a file, written chunk by chunk as it streams"""
+    try:
+        with open(path, "wb") as file:
+            async with AsyncSessionLocal() as db:
+                async for chunk in DestinationService(db).export_destinations(export_format, None, include_details):
+                    file.write(chunk)
+    finally:
+        await close_db()
+
+    print(f"Exported the destination catalog to {path}")
+    return 0
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m destination.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Bulk import destinations from NDJSON")
+    import_parser.add_argument("path", help="NDJSON file, one DestinationCreateRequest per line")
+    import_parser.add_argument("--chunk-size", type=int, default=None, help="Records per transaction")
+
+    export_parser = commands.add_parser("export", help="Export the destination catalog as NDJSON or CSV")
+    export_parser.add_argument("path", help="File to write")
+    export_parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    export_parser.add_argument("--details", action="store_true", help="Include the full destination details per row")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        sys.exit(asyncio.run(import_file(args.path, args.chunk_size)))
+    if args.command == "export":
+        sys.exit(asyncio.run(export_file(args.path, args.format, args.details)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
 import re
-from uuid import UUID
+from uuid import UUID, uuid4
 from decimal import Decimal
+from datetime import datetime
 from app.utils.print_log import print_log
-from typing import List, Tuple, Optional, Dict, Any
+from typing import AsyncIterator, List, Tuple, Optional, Dict, Any
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    select, update, delete, exists, func, tuple_, or_, cast, literal, literal_column, values, column,
+    union_all, true, and_, Float, Text, JSON,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert, JSONB, UUID as PG_UUID
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.exceptions import BadRequestError, ConflictError, RecordNotFoundError, ValidationError
+from app.db.counting import CountStrategy, count_rows
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.etag import make_etag
+from app.utils.geo import EARTH_RADIUS_M, covering_cells, point_geohash
 
 from destination.schema import (
   AccommodationTypeDetails,
@@ -17,9 +29,16 @@ from destination.schema import (
 from destination.schemas import (
   DestinationBasicDetails,
   DestinationFullDetails,
-  DestinationDetailsResponse
+  DestinationDetailsResponse,
+  DestinationListFilters,
+  DestinationListSort,
+  DestinationExportRow,
 )
 
+settings = get_settings()
+logger = setup_logging()
+
+
 def slugify(text: str) -> str:
     text = text.lower()
     text = re.sub(r"[^\w\s-]", "", text)
@@ -27,6 +46,14 @@ def slugify(text: str) -> str:
     return text.strip("-")
 
 
+from destination.helpers.cache import destination_details_cache, destination_missing_slugs
+from destination.helpers.view_counter import view_counter
+from destination.db.details_json import destination_details_json
+from destination.db.details_rows import load_details_rows, render_details
+from destination.db.loaders import (
+    DESTINATION_DETAILS_GRAPH,
+    DESTINATION_CREATED_GRAPH,
+)
 from destination.db.models import (
     Destination,
     AccommodationTypeRef,
@@ -41,191 +68,551 @@ from destination.db.models import (
     DietaryEnum,
     DestinationImage,
     AttractionImage,
+    CatalogVersion,
+    DestinationDocument,
+    REFERENCE_TYPES_VERSION,
+    DESTINATIONS_VERSION,
+    ATTRACTIONS_VERSION,
+    SEARCH_CONFIG,
+    CostLevel,
+)
+
+
+# fields a list card can ask for through `fields=`; everything except
+# images maps one to one onto a destinations column
+DESTINATION_LIST_FIELDS = tuple(DestinationBasicDetails.model_fields)
+
+# filterable list dimensions reported by get_facets
+DESTINATION_FACETS = tuple(DestinationListFilters.model_fields)
+
+
+def destination_etag(destination: Destination) -> str:
+    return make_etag(destination.id, destination.updated_at.isoformat(), destination.child_version)
+
+
+DIETARY_MAP = {
+    "vegetarian": DietaryEnum.VEG,
+    "non-vegetarian": DietaryEnum.NON_VEGAN,
+    "halal": DietaryEnum.HALAL,
+    "other": DietaryEnum.OTHER,
+}
+
+
+# Row builders for set-based inserts: DestinationCreateRequest dicts -> column
+# values, ids generated client side so children can reference their parent
+# without a flush. Core inserts skip the mapper events, so geohash is set here.
+
+def _decimal(value) -> Optional[Decimal]:
+    return Decimal(str(value)) if value else None
+
+
+def _split(value):
+    # comma separated string or list
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",")]
+    return value
+
+
+def _destination_values(data: dict) -> dict:
+    row = {
+        key: value for key, value in data.items()
+        if key not in DESTINATION_CHILD_KEYS
+    }
+    for key in ("longitude", "latitude"):
+        if row.get(key):
+            row[key] = Decimal(str(row[key]))
+    return row
+
+
+def _destination_row(data: dict, slug: str) -> dict:
+    row = _destination_values(data)
+    row.update(
+        id=uuid4(),
+        slug=slug,
+        geohash=point_geohash(row.get("latitude"), row.get("longitude")),
+    )
+    return row
+
+
+def _accommodation_type_row(destination_id: UUID, data: dict) -> dict:
+    return {
+        "id": uuid4(),
+        "destination_id": destination_id,
+        "type_ref_id": UUID(data["accommodation_type_id"]),
+        "price_range": data["price_range"],
+        "availability": data.get("availability"),
+        "description": data.get("description"),
+    }
+
+
+def _transport_option_row(destination_id: UUID, data: dict) -> dict:
+    return {
+        "id": uuid4(),
+        "destination_id": destination_id,
+        "transport_ref_id": UUID(data["transport_type_id"]),
+        "price_range": data["price_range"],
+        "availability": data.get("availability"),
+        "description": data.get("description"),
+    }
+
+
+def _activity_row(destination_id: UUID, data: dict) -> dict:
+    return {
+        "id": uuid4(),
+        "destination_id": destination_id,
+        "activity_ref_id": UUID(data["activity_type_id"]),
+        "price_range": data.get("price_range"),
+        "duration": data.get("duration"),
+        "best_season": data.get("best_season"),
+        "booking_required": data.get("booking_required", False),
+        "is_popular": data.get("is_popular", False),
+        "description": data.get("description"),
+    }
+
+
+def _signature_dish_row(destination_id: UUID, data: dict) -> dict:
+    dietary_info = data.get("dietary_info")
+    dietary_enums = [
+        DIETARY_MAP.get(item.lower(), DietaryEnum.OTHER)
+        for item in _split(dietary_info)
+    ] if dietary_info else None
+
+    return {
+        "id": uuid4(),
+        "destination_id": destination_id,
+        "name": data["name"],
+        "tags": _split(data.get("tags")),
+        "dietary_info": dietary_enums or None,
+        "price_range": data.get("price_range"),
+        "is_recommended": data.get("is_recommended", False),
+        "local_notes": data.get("local_notes"),
+    }
+
+
+def _accommodation_row(destination_id: UUID, data: dict, accommodation_type_ids: Dict[str, UUID]) -> dict:
+    type_ref_id = data.get("accommodation_type_id")
+    longitude = _decimal(data.get("longitude"))
+    latitude = _decimal(data.get("latitude"))
+    return {
+        "id": uuid4(),
+        "destination_id": destination_id,
+        "accommodation_type_id": accommodation_type_ids.get(type_ref_id) if type_ref_id else None,
+        "name": data["name"],
+        "price_range": data["price_range"],
+        "rating": _decimal(data.get("rating")),
+        "distance": data.get("distance"),
+        "region": data["region"],
+        "longitude": longitude,
+        "latitude": latitude,
+        "geohash": point_geohash(latitude, longitude),
+        "phone": data.get("phone"),
+        "email": data.get("email"),
+        "website": data.get("website"),
+    }
+
+
+def _attraction_row(destination_id: UUID, data: dict) -> dict:
+    longitude = _decimal(data.get("longitude"))
+    latitude = _decimal(data.get("latitude"))
+    return {
+        "id": uuid4(),
+        "destination_id": destination_id,
+        "name": data["name"],
+        "description": data.get("description"),
+        "tag": data.get("tag"),
+        "entry_fee": data.get("entry_fee"),
+        "opening_hours": data.get("opening_hours"),
+        "best_time_to_visit": data.get("best_time_to_visit"),
+        "available_transports": data.get("available_transports", []),
+        "is_recommended": data.get("is_recommended", False),
+        "region": data["region"],
+        "longitude": longitude,
+        "latitude": latitude,
+        "geohash": point_geohash(latitude, longitude),
+    }
+
+
+# advisory lock namespace (first key) for slug allocation
+SLUG_LOCK_CLASS = 7301
+# a slug can still be taken outside the allocator lock before our INSERT lands
+SLUG_INSERT_ATTEMPTS = 3
+
+DESTINATION_CHILD_KEYS = (
+    "accommodation_types",
+    "accommodations",
+    "transport_options",
+    "activities",
+    "signature_dishes",
+    "attractions",
 )
 
+# child collections in write order (accommodations point at accommodation types)
+DESTINATION_CHILD_TABLES = {
+    "accommodation_types": DestinationAccommodationType,
+    "transport_options": DestinationTransportOption,
+    "activities": DestinationActivity,
+    "signature_dishes": SignatureDish,
+    "accommodations": Accommodation,
+    "attractions": Attraction,
+}
+
+
+def _child_row(key: str, destination_id: UUID, data: dict, accommodation_type_ids: Dict[str, UUID]) -> dict:
+    if key == "accommodation_types":
+        return _accommodation_type_row(destination_id, data)
+    if key == "transport_options":
+        return _transport_option_row(destination_id, data)
+    if key == "activities":
+        return _activity_row(destination_id, data)
+    if key == "signature_dishes":
+        return _signature_dish_row(destination_id, data)
+    if key == "accommodations":
+        return _accommodation_row(destination_id, data, accommodation_type_ids)
+    return _attraction_row(destination_id, data)
+
 
 class DestinationCRUD:
     def __init__(self, db: AsyncSession):
       self.db = db
 
-    async def _generate_unique_slug(self, model, name: str) -> str:
-        base_slug = slugify(name)
-        slug = base_slug
-        counter = 1
+    async def _allocate_slugs(self, names: List[str]) -> List[str]:
+        """
+        Unique slugs for a batch of names with one query: every taken
+        `base` / `base-N` slug is read up front and suffixes are assigned
+        in memory, also de-duplicating names within the batch.
+
+        Creates of the same base name are serialized by a transaction
+        level advisory lock per base (taken in sorted order, so batches
+        cannot deadlock), so the read sees every committed competitor.
+        """
+        bases = [slugify(name) for name in names]
+        unique_bases = set(bases)
+
+        slug_bases = values(column("base", Text), name="slug_bases").data(
+            [(base,) for base in sorted(unique_bases)]
+        )
+        await self.db.execute(
+            select(func.pg_advisory_xact_lock(SLUG_LOCK_CLASS, func.hashtext(slug_bases.c.base)))
+            .select_from(slug_bases)
+        )
+
+        taken = set(await self.db.scalars(
+            select(Destination.slug).where(
+                or_(
+                    Destination.slug.in_(unique_bases),
+                    *[Destination.slug.like(f"{base}-%") for base in unique_bases],
+                )
+            )
+        ))
+
+        slugs = []
+        for base in bases:
+            slug = base
+            counter = 1
+            while slug in taken:
+                slug = f"{base}-{counter}"
+                counter += 1
+            taken.add(slug)
+            slugs.append(slug)
 
-        while True:
-            stmt = select(model.slug).where(model.slug == slug)
-            result = await self.db.execute(stmt)
-            exists = result.scalar_one_or_none()
+        return slugs
 
-            if not exists:
-                return slug
+    async def bulk_create(self, records: List[dict]) -> List[Tuple[UUID, str, List[dict]]]:
+        """
+        Insert a batch of destinations with all nested relationships inside
+        the caller's transaction: one multi-row INSERT per table, documents
+        rebuilt set-based. `records` are DestinationCreateRequest dicts whose
+        reference ids were already validated.
+
+        Returns (id, slug, attraction rows) per record, in order. The
+        destinations catalog version is left to the caller, after commit.
+        """
+        if not records:
+            return []
+
+        slugs = await self._allocate_slugs([record["name"] for record in records])
+
+        tables: Dict[Any, List[dict]] = {
+            Destination: [],
+            DestinationAccommodationType: [],
+            DestinationTransportOption: [],
+            DestinationActivity: [],
+            SignatureDish: [],
+            Accommodation: [],
+            Attraction: [],
+        }
+        created = []
+
+        for record, slug in zip(records, slugs):
+            destination = _destination_row(record, slug)
+            destination_id = destination["id"]
+            tables[Destination].append(destination)
+
+            accommodation_type_ids = {}
+            for data in record.get("accommodation_types", []):
+                row = _accommodation_type_row(destination_id, data)
+                accommodation_type_ids[data["accommodation_type_id"]] = row["id"]
+                tables[DestinationAccommodationType].append(row)
+
+            tables[DestinationTransportOption] += [
+                _transport_option_row(destination_id, data) for data in record.get("transport_options", [])
+            ]
+            tables[DestinationActivity] += [
+                _activity_row(destination_id, data) for data in record.get("activities", [])
+            ]
+            tables[SignatureDish] += [
+                _signature_dish_row(destination_id, data) for data in record.get("signature_dishes", [])
+            ]
+            tables[Accommodation] += [
+                _accommodation_row(destination_id, data, accommodation_type_ids)
+                for data in record.get("accommodations", [])
+            ]
+            attractions = [
+                _attraction_row(destination_id, data) for data in record.get("attractions", [])
+            ]
+            tables[Attraction] += attractions
+
+            created.append((destination, attractions))
+
+        await self._insert_destinations(tables.pop(Destination))
+
+        # parents first; Core executemany, no ORM bookkeeping per row
+        for model, rows in tables.items():
+            if rows:
+                await self.db.execute(insert(model.__table__), rows)
+
+        # set-based in Postgres whatever the configured engine, a batch's
+        # documents never need to round trip through the ORM
+        await self.rebuild_documents(
+            [destination["id"] for destination, _ in created],
+            engine="json",
+        )
+        if tables[Attraction]:
+            await CatalogVersionCRUD(self.db).bump(ATTRACTIONS_VERSION)
+
+        return [
+            (destination["id"], destination["slug"], attractions)
+            for destination, attractions in created
+        ]
+
+    async def _insert_destinations(self, rows: List[dict]) -> None:
+        """
+        INSERT destination rows with optimistically allocated slugs. Rows
+        whose slug was taken in the meantime are skipped by ON CONFLICT,
+        given fresh slugs and inserted again; no savepoint, and a single
+        statement when nothing raced.
+        """
+        pending = rows
+        for _ in range(SLUG_INSERT_ATTEMPTS):
+            inserted = set(await self.db.scalars(
+                insert(Destination.__table__)
+                .on_conflict_do_nothing(index_elements=[Destination.slug])
+                .returning(Destination.id),
+                pending,
+            ))
+            pending = [row for row in pending if row["id"] not in inserted]
+            if not pending:
+                return
+
+            slugs = await self._allocate_slugs([row["name"] for row in pending])
+            for row, slug in zip(pending, slugs):
+                row["slug"] = slug
+
+        raise ConflictError(
+            "Could not allocate a unique slug",
+            details={"names": [row["name"] for row in pending]},
+        )
 
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-  
     async def create(self, destination_data: dict) -> DestinationDetailsResponse:
         """
-        Create a destination with all nested relationships
+        Create a destination with all nested relationships: ids are generated
+        client side, so each table gets a single INSERT however large the
+        payload.
         """
         try:
-            # Extract nested data
-            accommodation_types_data = destination_data.pop("accommodation_types", [])
-            accommodations_data = destination_data.pop("accommodations", [])
-            transport_options_data = destination_data.pop("transport_options", [])
-            activities_data = destination_data.pop("activities", [])
-            signature_dishes_data = destination_data.pop("signature_dishes", [])
-            attractions_data = destination_data.pop("attractions", [])
-
-            # Convert string decimal fields to Decimal for main destination
-            if destination_data.get("longitude"):
-                destination_data["longitude"] = Decimal(str(destination_data["longitude"]))
-            
-            if destination_data.get("latitude"):
-                destination_data["latitude"] = Decimal(str(destination_data["latitude"]))
-
-            # Create the main destination
-            destination_data["slug"] = await self._generate_unique_slug(
-                model=Destination,
-                name=destination_data["name"]
-            )
-            new_destination = Destination(**destination_data)
-            self.db.add(new_destination)
-            await self.db.flush()
-
-            # Create accommodation types
-            accommodation_type_map = {}
-            for acc_type_data in accommodation_types_data:
-                accommodation_type = DestinationAccommodationType(
-                    destination_id=new_destination.id,
-                    type_ref_id=UUID(acc_type_data["accommodation_type_id"]),
-                    price_range=acc_type_data["price_range"],
-                    availability=acc_type_data.get("availability"),
-                    description=acc_type_data.get("description"),
-                )
-                self.db.add(accommodation_type)
-                await self.db.flush()
-                
-                accommodation_type_map[acc_type_data["accommodation_type_id"]] = accommodation_type.id
-
-            # Create transport options
-            for transport_data in transport_options_data:
-                transport_option = DestinationTransportOption(
-                    destination_id=new_destination.id,
-                    transport_ref_id=UUID(transport_data["transport_type_id"]),
-                    price_range=transport_data["price_range"],
-                    availability=transport_data.get("availability"),
-                    description=transport_data.get("description"),
-                )
-                self.db.add(transport_option)
-
-            # Create activities
-            for activity_data in activities_data:
-                activity = DestinationActivity(
-                    destination_id=new_destination.id,
-                    activity_ref_id=UUID(activity_data["activity_type_id"]),
-                    price_range=activity_data.get("price_range"),
-                    duration=activity_data.get("duration"),
-                    best_season=activity_data.get("best_season"),
-                    booking_required=activity_data.get("booking_required", False),
-                    is_popular=activity_data.get("is_popular", False),
-                    description=activity_data.get("description"),
-                )
-                self.db.add(activity)
-
-            # Create signature dishes
-            for dish_data in signature_dishes_data:
-                # Parse tags (can be comma-separated string or list)
-                tags = dish_data.get("tags")
-                if isinstance(tags, str):
-                    tags = [tag.strip() for tag in tags.split(",")]
-                
-                # Parse dietary info (can be comma-separated string or list)
-                dietary_info = dish_data.get("dietary_info")
-                dietary_enums = []
-                if dietary_info:
-                    if isinstance(dietary_info, str):
-                        dietary_list = [d.strip().lower() for d in dietary_info.split(",")]
-                    else:
-                        dietary_list = [d.lower() for d in dietary_info]
-                    
-                    # Map to enum values
-                    dietary_map = {
-                        "vegetarian": DietaryEnum.VEG,
-                        "non-vegetarian": DietaryEnum.NON_VEGAN,
-                        "halal": DietaryEnum.HALAL,
-                        "other": DietaryEnum.OTHER,
-                    }
-                    dietary_enums = [dietary_map.get(d, DietaryEnum.OTHER) for d in dietary_list]
-
-                signature_dish = SignatureDish(
-                    destination_id=new_destination.id,
-                    name=dish_data["name"],
-                    tags=tags,
-                    dietary_info=dietary_enums if dietary_enums else None,
-                    price_range=dish_data.get("price_range"),
-                    is_recommended=dish_data.get("is_recommended", False),
-                    local_notes=dish_data.get("local_notes"),
-                )
-                self.db.add(signature_dish)
-
-            # Create accommodations
-            for acc_data in accommodations_data:
-                type_ref_id = acc_data.get("accommodation_type_id")
-                junction_table_id = accommodation_type_map.get(type_ref_id) if type_ref_id else None
-                
-                accommodation = Accommodation(
-                    destination_id=new_destination.id,
-                    accommodation_type_id=junction_table_id,
-                    name=acc_data["name"],
-                    price_range=acc_data["price_range"],
-                    rating=Decimal(str(acc_data["rating"])) if acc_data.get("rating") else None,
-                    distance=acc_data.get("distance"),
-                    region=acc_data["region"],
-                    longitude=Decimal(str(acc_data["longitude"])) if acc_data.get("longitude") else None,
-                    latitude=Decimal(str(acc_data["latitude"])) if acc_data.get("latitude") else None,
-                    phone=acc_data.get("phone"),
-                    email=acc_data.get("email"),
-                    website=acc_data.get("website"),
-                )
-                self.db.add(accommodation)
-
-            # Create attractions
-            for attr_data in attractions_data:
-                attraction = Attraction(
-                    destination_id=new_destination.id,
-                    name=attr_data["name"],
-                    description=attr_data.get("description"),
-                    tag=attr_data.get("tag"),
-                    entry_fee=attr_data.get("entry_fee"),
-                    opening_hours=attr_data.get("opening_hours"),
-                    best_time_to_visit=attr_data.get("best_time_to_visit"),
-                    available_transports=attr_data.get("available_transports", []),
-                    is_recommended=attr_data.get("is_recommended", False),
-                    region=attr_data["region"],
-                    longitude=Decimal(str(attr_data["longitude"])) if attr_data.get("longitude") else None,
-                    latitude=Decimal(str(attr_data["latitude"])) if attr_data.get("latitude") else None,
-                )
-                self.db.add(attraction)
+            [(destination_id, slug, _)] = await self.bulk_create([destination_data])
 
             # Commit all changes
             await self.db.commit()
-            
-            stmt = (
-                select(Destination)
-                .options(selectinload(Destination.attractions))
-                .where(Destination.id == new_destination.id)
-            )
+            await CatalogVersionCRUD(self.db).bump_committed(DESTINATIONS_VERSION)
+            await destination_details_cache.delete(slug)
+            await destination_missing_slugs.delete(slug)
 
-            result = await self.db.execute(stmt)
-            destination = result.scalar_one()
-
-            return DestinationDetailsResponse.model_validate(destination)
+            return await self.get_details_response(destination_id)
         
         except Exception as e:
             await self.db.rollback()
             raise Exception(f"Error creating destination: {str(e)}")
 
+    async def get_details_response(self, destination_id: UUID) -> DestinationDetailsResponse:
+        stmt = (
+            select(Destination)
+            .options(*DESTINATION_CREATED_GRAPH)
+            .where(Destination.id == destination_id)
+        )
+
+        result = await self.db.execute(stmt)
+        destination = result.scalar_one()
+
+        return DestinationDetailsResponse.model_validate(destination)
+
+    async def update(self, destination_id: UUID, changes: dict) -> Tuple[List[UUID], List[dict]]:
+        """
+        Apply a partial update. Scalars are written only when they differ;
+        a sent child collection is diffed against the stored rows (items
+        with an id replace that row, items without one are inserted, rows
+        left out are deleted), so each child table gets at most one DELETE
+        and one INSERT ... ON CONFLICT for the changed rows. The destination
+        row is updated once (updated_at, child_version) and its document
+        rebuilt, and only if something changed.
+
+        The slug is kept when the name changes, so links stay valid.
+        Removing an accommodation type that accommodations still use is a
+        ConflictError unless the accommodations are sent in the same PATCH.
+
+        Returns the deleted attraction ids and the written attraction rows.
+        """
+        table = Destination.__table__
+        collections = {
+            key: changes.pop(key) for key in DESTINATION_CHILD_TABLES
+            if key in changes
+        }
+        collections = {key: items for key, items in collections.items() if items is not None}
+
+        not_null = [key for key, value in changes.items() if value is None and not table.c[key].nullable]
+        if not_null:
+            raise ValidationError(f"Fields cannot be null: {', '.join(not_null)}")
+
+        current = (await self.db.execute(
+            select(table).where(table.c.id == destination_id).with_for_update()
+        )).mappings().first()
+        if current is None:
+            raise RecordNotFoundError("Destination", destination_id)
+
+        values = {
+            key: value for key, value in _destination_values(changes).items()
+            if current[key] != value
+        }
+        if "latitude" in values or "longitude" in values:
+            values["geohash"] = point_geohash(
+                values.get("latitude", current["latitude"]),
+                values.get("longitude", current["longitude"]),
+            )
+
+        # stored rows of every collection the diff needs
+        loaded = set(collections)
+        if "accommodations" in collections:
+            loaded.add("accommodation_types")
+        existing = {}
+        for key in loaded:
+            model = DESTINATION_CHILD_TABLES[key]
+            rows = (await self.db.execute(
+                select(model.__table__).where(model.__table__.c.destination_id == destination_id)
+            )).mappings().all()
+            existing[key] = {row["id"]: row for row in rows}
+
+        unknown = [
+            str(item["id"])
+            for key, items in collections.items()
+            for item in items
+            if item.get("id") is not None and item["id"] not in existing[key]
+        ]
+        if unknown:
+            raise ValidationError(
+                "Unknown child ids for this destination",
+                details={"ids": unknown},
+            )
+
+        accommodation_type_ids = {
+            str(row["type_ref_id"]): row["id"] for row in existing.get("accommodation_types", {}).values()
+        }
+        written: Dict[str, List[dict]] = {}
+        deleted: Dict[str, List[UUID]] = {}
+
+        for key, model in DESTINATION_CHILD_TABLES.items():
+            if key not in collections:
+                continue
+
+            stored = existing[key]
+            rows = []
+            for item in collections[key]:
+                row = _child_row(key, destination_id, item, accommodation_type_ids)
+                if item.get("id") is not None:
+                    row["id"] = item["id"]
+                rows.append(row)
+
+            if key == "accommodation_types":
+                accommodation_type_ids = {
+                    item["accommodation_type_id"]: row["id"]
+                    for item, row in zip(collections[key], rows)
+                }
+
+            kept = {row["id"] for row in rows}
+            deleted[key] = [child_id for child_id in stored if child_id not in kept]
+
+            if key == "accommodation_types" and deleted[key] and "accommodations" not in collections:
+                # the FK would silently clear the type of accommodations this
+                # PATCH never sent (ON DELETE SET NULL)
+                in_use = (await self.db.execute(
+                    select(Accommodation.id, Accommodation.accommodation_type_id)
+                    .where(Accommodation.accommodation_type_id.in_(deleted[key]))
+                )).all()
+                if in_use:
+                    raise ConflictError(
+                        "Accommodation types are still used by accommodations",
+                        details={
+                            "accommodation_type_ids": sorted({str(type_id) for _, type_id in in_use}),
+                            "accommodation_ids": [str(accommodation_id) for accommodation_id, _ in in_use],
+                        },
+                    )
+            written[key] = [
+                row for row in rows
+                if row["id"] not in stored
+                or any(stored[row["id"]][name] != value for name, value in row.items())
+            ]
+
+            child_table = model.__table__
+            if deleted[key]:
+                await self.db.execute(
+                    delete(child_table).where(child_table.c.id.in_(deleted[key]))
+                )
+            if written[key]:
+                stmt = insert(child_table)
+                overwrite = {
+                    name: stmt.excluded[name] for name in written[key][0]
+                    if name not in ("id", "destination_id")
+                }
+                if "updated_at" in child_table.c:
+                    overwrite["updated_at"] = func.now()
+                await self.db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[child_table.c.id],
+                        set_=overwrite,
+                        # an id of another destination's child never matches
+                        where=child_table.c.destination_id == stmt.excluded.destination_id,
+                    ),
+                    written[key],
+                )
+
+        children_changed = any(deleted.values()) or any(written.values())
+        if not values and not children_changed:
+            return [], []
+
+        if children_changed:
+            values["child_version"] = table.c.child_version + 1
+        await self.db.execute(update(table).where(table.c.id == destination_id).values(**values))
+
+        # rendered in Postgres, an edit does not reload the whole graph
+        await self.rebuild_documents([destination_id], engine="json")
+        attractions_changed = deleted.get("attractions") or written.get("attractions")
+        if attractions_changed:
+            await CatalogVersionCRUD(self.db).bump(ATTRACTIONS_VERSION)
+        await self.db.commit()
+        await CatalogVersionCRUD(self.db).bump_committed(DESTINATIONS_VERSION)
+        await destination_details_cache.delete(current["slug"])
+
+        return deleted.get("attractions", []), written.get("attractions", [])
+
     async def add_destination_images(self, image_data: List[Dict[str, Any]]) -> list[DestinationImageDetails]:
         if not image_data:
             return []
@@ -242,7 +629,13 @@ class DestinationCRUD:
             self.db.add(dest_img)
             created_images.append(dest_img)
 
+        await self._children_changed({img["destination_id"] for img in image_data})
         await self.db.commit()
+        await CatalogVersionCRUD(self.db).bump_committed(DESTINATIONS_VERSION)
+        await self._invalidate_details(
+            select(Destination.slug)
+            .where(Destination.id.in_({img["destination_id"] for img in image_data}))
+        )
 
         for img in created_images:
             await self.db.refresh(img)
@@ -265,88 +658,679 @@ class DestinationCRUD:
             self.db.add(attraction_img)
             created_images.append(attraction_img)
 
+        await self._children_changed(
+            await self.db.scalars(
+                select(Attraction.destination_id)
+                .where(Attraction.id.in_({img["attraction_id"] for img in image_data}))
+            )
+        )
         await self.db.commit()
+        await CatalogVersionCRUD(self.db).bump_committed(DESTINATIONS_VERSION)
+        await self._invalidate_details(
+            select(Destination.slug)
+            .join(Attraction, Attraction.destination_id == Destination.id)
+            .where(Attraction.id.in_({img["attraction_id"] for img in image_data}))
+        )
 
         for img in created_images:
             await self.db.refresh(img)
 
         return created_images
+
+    async def _children_changed(self, destination_ids) -> None:
+        """
+        Bump child_version (and so the etag) of the destinations whose child
+        collections changed, then re-materialize their documents
+        """
+        destination_ids = set(destination_ids)
+        if not destination_ids:
+            return
+
+        await self.db.execute(
+            update(Destination)
+            .where(Destination.id.in_(destination_ids))
+            .values(child_version=Destination.child_version + 1)
+        )
+        await self.rebuild_documents(destination_ids)
+
+    async def _invalidate_details(self, slug_stmt) -> None:
+        """Drop cached details for the destinations selected by slug_stmt"""
+        slugs = (await self.db.scalars(slug_stmt)).all()
+        await destination_details_cache.delete(*slugs)
     
     async def get_list(
         self,
         page: int = 1,
         page_size: int = 10,
         search_query: str | None = None,
-    ) -> Tuple[List[DestinationBasicDetails], int]:
+        cursor: str | None = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Optional[CountStrategy] = None,
+        filters: Optional[DestinationListFilters] = None,
+        sort: Optional[DestinationListSort] = None,
+        facets: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[str], Optional[Dict[str, Dict[str, int]]]]:
+        """
+        List destinations matching the search and facet filters, newest
+        first, by search relevance, or by the precomputed trending score
+        (sort="trending").
+
+        With a cursor the page is located by keyset on the sort key and the
+        exact total is skipped, so every page costs the same. Without a
+        cursor it falls back to page/offset, with the total computed per the
+        `count` strategy (see app.db.counting).
+
+        With `facets` the per-value facet counts (see `_facet_counts`) come
+        back in the same statement as the page, and so does an exact total,
+        counted over the same matched rows instead of in a separate query.
+
+        Only the columns behind `fields` (default: every DestinationBasicDetails
+        field) are selected, and images are fetched in one extra query only
+        when asked for. Items are returned as plain dicts keyed by field.
+        """
+        fields = fields or DESTINATION_LIST_FIELDS
+        columns = [getattr(Destination, name) for name in fields if name != "images"]
+
+        sort_key, conditions = self._list_conditions(search_query, filters, sort)
+        numeric_key = bool(search_query) or sort == "trending"
 
         stmt = (
-            select(Destination)
-            .options(selectinload(Destination.images))
+            select(
+                Destination.id.label("_id"),
+                *columns,
+                sort_key.label("_sort_key"),
+            )
+            .where(*conditions)
         )
 
-        if search_query:
-            stmt = stmt.where(Destination.name.ilike(f"%{search_query}%"))
+        strategy = count or settings.list_count_strategy
+        facet_total = facets and not cursor and strategy == "exact"
 
-        # Total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = await self.db.scalar(count_stmt)
+        total = None
+        if cursor:
+            last_key, last_id = decode_cursor(cursor, size=2)
+            try:
+                last_key = float(last_key) if numeric_key else datetime.fromisoformat(last_key)
+                last_id = UUID(last_id)
+            except (TypeError, ValueError, AttributeError):
+                # AttributeError: non-string values, e.g. UUID(5)
+                raise BadRequestError("Invalid pagination cursor")
 
-        # Pagination
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+            stmt = stmt.where(
+                tuple_(sort_key, Destination.id) < tuple_(last_key, last_id)
+            )
+        else:
+            if not facet_total:
+                cache_key = None
+                if strategy == "exact":
+                    version = await CatalogVersionCRUD(self.db).get(DESTINATIONS_VERSION)
+                    cache_key = ("destinations", version, search_query, filters)
 
-        result = await self.db.execute(stmt)
-        destinations = result.scalars().all()
+                total = await count_rows(
+                    self.db,
+                    select(Destination.id).where(*conditions),
+                    count,
+                    cache_key=cache_key,
+                )
 
-        return (
-            [DestinationBasicDetails.model_validate(d) for d in destinations],
-            total
+            stmt = stmt.offset((page - 1) * page_size)
+
+        # one extra row tells us whether there is a next page
+        stmt = (
+            stmt.order_by(sort_key.desc(), Destination.id.desc())
+            .limit(page_size + 1)
         )
 
-    async def get_by_slug(self, slug: str) -> DestinationFullDetails:
+        facet_counts = None
+        if facets:
+            # the one-row facet summary, outer joined so an empty page still
+            # returns it; the page rows are then the ones with an _id
+            page_rows = stmt.subquery("page")
+            summary = self._facet_counts(conditions, facet_total)
+            stmt = (
+                select(summary.c._facets, page_rows)
+                .select_from(summary.outerjoin(page_rows, true()))
+                .order_by(page_rows.c._sort_key.desc(), page_rows.c._id.desc())
+            )
+
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        if facets:
+            facet_counts = {name: {} for name in DESTINATION_FACETS}
+            for facet, value, value_count in sorted(rows[0]._facets, key=lambda entry: (-entry[2], entry[1] or "")):
+                if facet == "_total":
+                    total = value_count
+                    continue
+                if facet == "cost_level":
+                    value = CostLevel[value].value
+                facet_counts[facet][value] = value_count
+            rows = [row for row in rows if row._id is not None]
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            last_key = last._sort_key if numeric_key else last._sort_key.isoformat()
+            next_cursor = encode_cursor(last_key, last._id)
+
+        items = []
+        for row in rows:
+            item = {column.key: row._mapping[column.key] for column in columns}
+            if item.get("cost_level") is not None:
+                item["cost_level"] = item["cost_level"].value
+            items.append(item)
+
+        if "images" in fields:
+            images = await self._list_images([row._id for row in rows])
+            for row, item in zip(rows, items):
+                item["images"] = images.get(row._id, [])
+
+        return items, total, next_cursor, facet_counts
+
+    def _list_conditions(
+        self,
+        search_query: Optional[str] = None,
+        filters: Optional[DestinationListFilters] = None,
+        sort: Optional[DestinationListSort] = None,
+    ):
+        """Sort key and where clauses shared by the list and its facets"""
+        conditions = []
+
+        if search_query:
+            # weighted full-text match, plus trigram similarity on the name
+            # for typos and substring lookups (both served by GIN indexes)
+            tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, search_query)
+            sort_key = cast(
+                func.coalesce(func.ts_rank_cd(Destination.search_vector, tsquery), 0)
+                + func.similarity(Destination.name, search_query),
+                Float,
+            )
+            conditions.append(
+                or_(
+                    Destination.search_vector.op("@@")(tsquery),
+                    Destination.name.op("%")(search_query),
+                    Destination.name.ilike(f"%{search_query}%"),
+                )
+            )
+        else:
+            sort_key = Destination.created_at
+
+        if sort == "trending":
+            # served by ix_destinations_trending_score_id
+            sort_key = Destination.trending_score
+
+        if filters:
+            # any of the given values (btree indexes)
+            for name in ("country", "region", "cost_level"):
+                wanted = getattr(filters, name)
+                if wanted:
+                    conditions.append(getattr(Destination, name).in_(wanted))
+
+            # all of the given values (@>, GIN indexes)
+            for name in ("tags", "suitable_for", "popular_for"):
+                wanted = getattr(filters, name)
+                if wanted:
+                    array_column = getattr(Destination, name)
+                    conditions.append(
+                        array_column.op("@>")(literal(list(wanted), array_column.type))
+                    )
+
+        return sort_key, conditions
+
+    async def stream_export(
+        self,
+        filters: Optional[DestinationListFilters] = None,
+        include_details: bool = False,
+    ) -> AsyncIterator[List[Tuple[Dict[str, Any], Optional[str]]]]:
+        """
+        Destinations matching `filters`, oldest first, read through a
+        server-side cursor `destination_export_batch_size` rows at a time.
+
+        Yields one batch per round trip as (row, details) pairs: `row` holds
+        the DestinationExportRow columns and `details` the
+        DestinationFullDetails JSON text with `include_details` (the
+        materialized document, built from rows where there is none yet),
+        None otherwise.
+        """
+        _, conditions = self._list_conditions(filters=filters)
+        stmt = select(*(getattr(Destination, name) for name in DestinationExportRow.model_fields))
+
+        if include_details:
+            stmt = stmt.add_columns(
+                cast(DestinationDocument.document, Text).label("_details")
+            ).outerjoin(
+                DestinationDocument,
+                DestinationDocument.destination_id == Destination.id,
+            )
+
         stmt = (
-            select(Destination)
-            .where(Destination.slug == slug)
-            .options(selectinload(Destination.images))
-            .options(
-                selectinload(Destination.attractions)
-                .selectinload(Attraction.images)  # Load attraction images
+            stmt.where(*conditions)
+            .order_by(Destination.created_at, Destination.id)
+            .execution_options(yield_per=settings.destination_export_batch_size)
+        )
+
+        result = await self.db.stream(stmt)
+        async for partition in result.partitions():
+            rows = [row._asdict() for row in partition]
+            details = [row.pop("_details", None) for row in rows]
+
+            missing = [row["id"] for row, document in zip(rows, details) if include_details and document is None]
+            if missing:
+                built = {
+                    destination.id: render_details(document)
+                    for destination, document in await load_details_rows(self.db, missing)
+                }
+                details = [document or built.get(row["id"]) for row, document in zip(rows, details)]
+
+            yield list(zip(rows, details))
+
+    def _facet_counts(self, conditions: list, with_total: bool = False):
+        """
+        One-row subquery whose `_facets` column is a JSON array of
+        [facet, value, count] for every facet over the destinations matching
+        `conditions`, plus ["_total", null, count] when `with_total`.
+
+        The matching rows are collected once in a CTE and every facet is a
+        GROUP BY over it, glued together with UNION ALL.
+        """
+        matched = (
+            select(*(getattr(Destination, name) for name in DESTINATION_FACETS))
+            .where(*conditions)
+            .cte("matched")
+        )
+
+        facet_stmts = []
+        for name in DESTINATION_FACETS:
+            facet_column = matched.c[name]
+            if name in ("tags", "suitable_for", "popular_for"):
+                value = func.unnest(facet_column).table_valued("value").render_derived().lateral()
+                stmt = select(
+                    literal(name).label("facet"),
+                    cast(value.c.value, Text).label("value"),
+                    func.count().label("count"),
+                ).select_from(matched).join(value, true())
+            else:
+                stmt = select(
+                    literal(name).label("facet"),
+                    cast(facet_column, Text).label("value"),
+                    func.count().label("count"),
+                ).select_from(matched).where(facet_column.is_not(None))
+            facet_stmts.append(stmt.group_by(literal_column("2")))
+
+        if with_total:
+            facet_stmts.append(
+                select(
+                    literal("_total").label("facet"),
+                    literal(None, Text).label("value"),
+                    func.count().label("count"),
+                ).select_from(matched)
             )
-            .options(selectinload(Destination.signature_dishes))
-            .options(
-                selectinload(Destination.transportation_options)
-                .selectinload(DestinationTransportOption.transport_ref)  # Load transport name
+
+        counts = union_all(*facet_stmts).subquery("facet_counts")
+        return select(
+            func.coalesce(
+                func.json_agg(func.json_build_array(counts.c.facet, counts.c.value, counts.c.count)),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            ).label("_facets")
+        ).subquery("facets")
+
+    async def _list_images(self, destination_ids: List[UUID]) -> Dict[UUID, List[Dict[str, Any]]]:
+        """Card images for a page of destinations, keyed by destination id"""
+        if not destination_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(
+                DestinationImage.destination_id,
+                DestinationImage.image_url,
+                DestinationImage.alt_text,
             )
-            .options(
-                selectinload(Destination.activities)
-                .selectinload(DestinationActivity.activity_ref)  # Load activity name
+            .where(DestinationImage.destination_id.in_(destination_ids))
+            .order_by(DestinationImage.created_at, DestinationImage.id)
+        )
+
+        images: Dict[UUID, List[Dict[str, Any]]] = {}
+        for destination_id, image_url, alt_text in result.all():
+            images.setdefault(destination_id, []).append(
+                {"image_url": image_url, "alt_text": alt_text}
             )
-            .options(
-                selectinload(Destination.accommodations)
-                .selectinload(Accommodation.accommodation_type)
-                .selectinload(DestinationAccommodationType.type_ref)  # Load accommodation type name
+        return images
+
+    def _full_details_stmt(self):
+        """Destination with every relationship DestinationFullDetails renders"""
+        return select(Destination).options(*DESTINATION_DETAILS_GRAPH)
+
+    async def get_by_slug(self, slug: str) -> DestinationFullDetails:
+        destination_id = await self.get_id_by_slug(slug)
+
+        loaded = await load_details_rows(self.db, [destination_id])
+        if not loaded:
+            raise RecordNotFoundError("Destination", slug)
+
+        [(_, details)] = loaded
+        return DestinationFullDetails.model_validate(details)
+
+    async def get_id_by_slug(self, slug: str) -> UUID:
+        destination_id = await self.db.scalar(select(Destination.id).where(Destination.slug == slug))
+        if destination_id is None:
+            raise RecordNotFoundError("Destination", slug)
+
+        return destination_id
+
+    async def get_document(self, slug: str) -> Optional[Tuple[str, bytes]]:
+        """Etag and materialized DestinationFullDetails JSON for the slug, if built"""
+        row = (await self.db.execute(
+            select(DestinationDocument.etag, cast(DestinationDocument.document, Text))
+            .where(DestinationDocument.slug == slug)
+        )).first()
+        return (row[0], row[1].encode()) if row else None
+
+    async def get_document_etag(self, slug: str) -> Optional[str]:
+        return await self.db.scalar(
+            select(DestinationDocument.etag).where(DestinationDocument.slug == slug)
+        )
+
+    async def get_view_count(self, slug: str) -> Optional[int]:
+        """destinations.view_count as last flushed, None for an unknown slug"""
+        return await self.db.scalar(
+            select(func.coalesce(Destination.view_count, 0)).where(Destination.slug == slug)
+        )
+
+    async def get_details_json(self, slug: str) -> Optional[Tuple[str, bytes]]:
+        """Etag and DestinationFullDetails JSON built by Postgres in one statement"""
+        row = (await self.db.execute(
+            destination_details_json(
+                Destination.id,
+                Destination.updated_at,
+                Destination.child_version,
             )
-            .options(
-                selectinload(Destination.accommodation_types)
-                .selectinload(DestinationAccommodationType.type_ref)  # Load accommodation type name
+            .where(Destination.slug == slug)
+        )).first()
+        return (destination_etag(row), row.details.encode()) if row else None
+
+    async def rebuild_documents(self, destination_ids, engine: Optional[str] = None) -> Dict[str, Tuple[str, bytes]]:
+        """
+        Re-materialize the details documents of the given destinations inside
+        the caller's transaction. Returns the fresh (etag, document) pairs
+        keyed by slug.
+
+        `engine` (default `destination_details_engine`) picks how the
+        documents are built: "rows" loads one Core SELECT per collection and
+        validates plain dicts, "orm" loads the mapped graph and validates it
+        through `from_attributes`, "json" renders and stores it in Postgres
+        without the documents leaving the database.
+        """
+        destination_ids = set(destination_ids)
+        if not destination_ids:
+            return {}
+
+        # pending children must be visible to the reload below
+        await self.db.flush()
+
+        engine = engine or settings.destination_details_engine
+        if engine == "json":
+            return await self._rebuild_documents_json(destination_ids)
+
+        if engine == "rows":
+            documents = {
+                row.id: (row.slug, destination_etag(row), render_details(details))
+                for row, details in await load_details_rows(self.db, destination_ids)
+            }
+        else:
+            stmt = (
+                self._full_details_stmt()
+                .where(Destination.id.in_(destination_ids))
+                .execution_options(populate_existing=True)
             )
+            documents = {
+                destination.id: (
+                    destination.slug,
+                    destination_etag(destination),
+                    DestinationFullDetails.model_validate(destination).model_dump_json(),
+                )
+                for destination in (await self.db.scalars(stmt)).all()
+            }
+
+        if not documents:
+            return {}
+
+        stmt = insert(DestinationDocument).values([
+            {
+                "destination_id": destination_id,
+                "slug": slug,
+                "etag": etag,
+                "document": cast(literal(document, Text), JSONB),
+            }
+            for destination_id, (slug, etag, document) in documents.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DestinationDocument.destination_id],
+            set_={
+                "slug": stmt.excluded.slug,
+                "etag": stmt.excluded.etag,
+                "document": stmt.excluded.document,
+                "updated_at": func.now(),
+            },
         )
+        await self.db.execute(stmt)
 
-        result = await self.db.execute(stmt)
-        destination = result.scalar_one()
+        return {
+            slug: (etag, document.encode())
+            for slug, etag, document in documents.values()
+        }
 
-        return DestinationFullDetails.model_validate(destination)
+    async def _rebuild_documents_json(self, destination_ids) -> Dict[str, Tuple[str, bytes]]:
+        rows = (await self.db.execute(
+            select(Destination.id, Destination.updated_at, Destination.child_version)
+            .where(Destination.id.in_(destination_ids))
+        )).all()
+        if not rows:
+            return {}
 
+        etags = values(
+            column("destination_id", PG_UUID(as_uuid=True)),
+            column("etag", Text),
+            name="etags",
+        ).data([(row.id, destination_etag(row)) for row in rows])
 
-    async def delete(self, destination_id) -> None:
-        stmt = select(Destination).where(Destination.id == destination_id)
-        result = await self.db.execute(stmt)
-        destination = result.scalar_one_or_none()
+        documents = (
+            destination_details_json(Destination.id, Destination.slug, etags.c.etag)
+            .join(etags, etags.c.destination_id == Destination.id)
+            .subquery()
+        )
+
+        stmt = insert(DestinationDocument).from_select(
+            ["destination_id", "slug", "etag", "document"],
+            select(
+                documents.c.id,
+                documents.c.slug,
+                documents.c.etag,
+                cast(documents.c.details, JSONB),
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DestinationDocument.destination_id],
+            set_={
+                "slug": stmt.excluded.slug,
+                "etag": stmt.excluded.etag,
+                "document": stmt.excluded.document,
+                "updated_at": func.now(),
+            },
+        ).returning(
+            DestinationDocument.slug,
+            DestinationDocument.etag,
+            cast(DestinationDocument.document, Text),
+        )
+
+        return {
+            slug: (etag, document.encode())
+            for slug, etag, document in (await self.db.execute(stmt)).all()
+        }
+
+
+    async def delete(self, destination_id) -> List[str]:
+        """
+        Delete a destination in one statement: the ON DELETE CASCADE foreign
+        keys remove the children, and the Cloudinary public_ids of its
+        destination and attraction images come back from the same statement.
 
-        if not destination:
-            raise ValueError("Destination not found")
+        Returns the public_ids, for the caller to purge once committed.
+        """
+        destination_images = (
+            delete(DestinationImage)
+            .where(DestinationImage.destination_id == destination_id)
+            .returning(DestinationImage.public_id)
+            .cte("destination_images")
+        )
+        attraction_images = (
+            delete(AttractionImage)
+            .where(AttractionImage.attraction_id.in_(
+                select(Attraction.id).where(Attraction.destination_id == destination_id)
+            ))
+            .returning(AttractionImage.public_id)
+            .cte("attraction_images")
+        )
+        deleted = (
+            delete(Destination)
+            .where(Destination.id == destination_id)
+            .returning(Destination.slug)
+            .cte("deleted")
+        )
+        public_ids = union_all(
+            select(destination_images.c.public_id),
+            select(attraction_images.c.public_id),
+        ).subquery()
 
-        await self.db.delete(destination)
+        row = (await self.db.execute(
+            select(
+                deleted.c.slug,
+                select(func.array_agg(public_ids.c.public_id))
+                .where(public_ids.c.public_id.is_not(None))
+                .scalar_subquery()
+                .label("public_ids"),
+                # the statement snapshot still sees the attractions
+                exists().where(Attraction.destination_id == destination_id).label("had_attractions"),
+            )
+        )).first()
+
+        if row is None:
+            raise RecordNotFoundError("Destination", destination_id)
+
+        if row.had_attractions:
+            await CatalogVersionCRUD(self.db).bump(ATTRACTIONS_VERSION)
         await self.db.commit()
+        await CatalogVersionCRUD(self.db).bump_committed(DESTINATIONS_VERSION)
+        await destination_details_cache.delete(row.slug)
+        await view_counter.forget(row.slug)
+
+        return row.public_ids or []
+
+
+class GeoCRUD:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def nearby(
+        self,
+        model,
+        columns,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        limit: int = 20,
+    ):
+        """
+        Rows of a geohashed model (see GEO_MODELS) within radius_m of the
+        point, closest first, with their distance as `distance_m`.
+
+        The geohash btree narrows the scan to the 3x3 block of cells that
+        covers the circle; the exact haversine distance filters and sorts
+        what is left.
+        """
+        cells = covering_cells(latitude, longitude, radius_m)
+        distance = _distance_m(model.latitude, model.longitude, latitude, longitude)
+
+        stmt = (
+            select(*columns, distance.label("distance_m"))
+            .where(
+                or_(*[
+                    # "{" sorts right after "z", the last geohash character
+                    and_(model.geohash >= cell, model.geohash < cell + "{")
+                    for cell in cells
+                ])
+            )
+            .where(distance <= radius_m)
+            .order_by(distance)
+            .limit(limit)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+
+def _distance_m(latitude_column, longitude_column, latitude: float, longitude: float):
+    """Haversine distance in metres between a row's coordinates and a point"""
+    row_latitude = cast(latitude_column, Float)
+    row_longitude = cast(longitude_column, Float)
+    a = (
+        func.power(func.sin(func.radians(row_latitude - latitude) / 2), 2)
+        + func.cos(func.radians(latitude))
+        * func.cos(func.radians(row_latitude))
+        * func.power(func.sin(func.radians(row_longitude - longitude) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_M * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+class CatalogVersionCRUD:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, name: str) -> int:
+        """Current version of a catalog section (0 if never bumped)"""
+        version = await self.db.scalar(
+            select(CatalogVersion.version).where(CatalogVersion.name == name)
+        )
+        return version or 0
+
+    async def bump(self, name: str) -> int:
+        """Increment a catalog section version inside the caller's transaction"""
+        return await self.db.scalar(self.bump_stmt(name))
+
+    async def bump_committed(self, name: str) -> None:
+        """
+        Increment a catalog section version in a transaction of its own, once
+        the caller committed the data it covers. The version row is locked
+        for this statement only instead of for every writer's transaction.
+
+        A reader between the two commits gets the new data under the old
+        version and revalidates on its next request. A failed bump is logged
+        and the version catches up with the next write.
+        """
+        try:
+            await self.db.execute(self.bump_stmt(name))
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Could not bump the {name} catalog version: {e}")
+
+    @staticmethod
+    def bump_stmt(name: str):
+        """The bump statement, for callers on a sync session (Celery tasks)"""
+        return (
+            insert(CatalogVersion)
+            .values(name=name, version=1)
+            .on_conflict_do_update(
+                index_elements=[CatalogVersion.name],
+                set_={
+                    "version": CatalogVersion.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(CatalogVersion.version)
+        )
+
 
 class AccommodationCRUD:
     def __init__(self, db: AsyncSession):
@@ -355,6 +1339,7 @@ class AccommodationCRUD:
     async def create_accommodation_type(self, accommodation_data: dict) -> AccommodationTypeDetails:
         new_accommodation = AccommodationTypeRef(**accommodation_data)
         self.db.add(new_accommodation)
+        await CatalogVersionCRUD(self.db).bump(REFERENCE_TYPES_VERSION)
         await self.db.commit()
         await self.db.refresh(new_accommodation)
         return AccommodationTypeDetails.model_validate(new_accommodation)
@@ -381,6 +1366,7 @@ class TransportCRUD:
     async def create_transport_type(self, transport_data: dict) -> TransportTypeDetails:
         new_transport = TransportTypeRef(**transport_data)
         self.db.add(new_transport)
+        await CatalogVersionCRUD(self.db).bump(REFERENCE_TYPES_VERSION)
         await self.db.commit()
         await self.db.refresh(new_transport)
         return TransportTypeDetails.model_validate(new_transport)
@@ -407,6 +1393,7 @@ class ActivityCRUD:
     async def create_activity_type(self, activity_data: dict) -> ActivityTypeDetails:
         new_activity = ActivityTypeRef(**activity_data)
         self.db.add(new_activity)
+        await CatalogVersionCRUD(self.db).bump(REFERENCE_TYPES_VERSION)
         await self.db.commit()
         await self.db.refresh(new_activity)
         return ActivityTypeDetails.model_validate(new_activity)
@@ -0,0 +1,228 @@
+"""
+DestinationFullDetails built by Postgres in a single statement.
+
+The tree is assembled with json_build_object / json_agg over LATERAL
+subqueries, one per collection, so a details read is one round trip instead
+of one per relationship level, and the result is JSON text that never goes
+through the ORM or pydantic.
+
+Keys come from the pydantic schemas and values are converted the way
+DestinationFullDetails.model_dump_json() renders them: enums by value,
+decimals as strings, timestamps as UTC ISO-8601 with a "Z" suffix.
+Collections are ordered by creation time.
+"""
+from typing import Union, get_args, get_origin
+
+from sqlalchemy import (
+    select, func, case, cast, literal_column, true,
+    Text, Enum, ARRAY, Numeric, Float, DateTime,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from destination.db.models import (
+    Destination,
+    AccommodationTypeRef,
+    DestinationAccommodationType,
+    Accommodation,
+    TransportTypeRef,
+    DestinationTransportOption,
+    ActivityTypeRef,
+    DestinationActivity,
+    SignatureDish,
+    Attraction,
+    DestinationImage,
+    AttractionImage,
+)
+from destination.schemas.details import (
+    AttractionImageDetails,
+    DestinationImageDetails,
+    AttractionDetails,
+    AccommodationTypeRefDetails,
+    AccommodationTypeDetails,
+    AccommodationTypeForAccommodation,
+    AccommodationDetails,
+    TransportRefDetails,
+    TransportOptionDetails,
+    ActivityRefDetails,
+    ActivityDetails,
+    SignatureDishResponse,
+    DestinationFullDetails,
+)
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+ISO_SECONDS = 'YYYY-MM-DD"T"HH24:MI:SS"Z"'
+ISO_MICROSECONDS = 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+
+
+def _sql_string(value: str):
+    # constants are inlined so the statement carries no bind parameters
+    return literal_column("'" + value.replace("'", "''") + "'")
+
+
+def _nullable(annotation) -> bool:
+    return get_origin(annotation) is Union and type(None) in get_args(annotation)
+
+
+def _enum_value(column, enum_class):
+    # SQLAlchemy stores enum names, the API renders values
+    return case(
+        {member.name: _sql_string(member.value) for member in enum_class},
+        value=cast(column, Text),
+    )
+
+
+def _timestamp(column):
+    # pydantic drops the fraction when it is zero
+    utc = func.timezone(_sql_string("UTC"), column)
+    return case(
+        (
+            func.to_char(utc, _sql_string("US")) == _sql_string("000000"),
+            func.to_char(utc, _sql_string(ISO_SECONDS)),
+        ),
+        else_=func.to_char(utc, _sql_string(ISO_MICROSECONDS)),
+    )
+
+
+def _enum_array(column, enum_class):
+    item = func.unnest(column).table_valued("value").render_derived()
+    return (
+        select(func.json_agg(_enum_value(item.c.value, enum_class)))
+        .select_from(item)
+        .scalar_subquery()
+    )
+
+
+def _json_value(column, field):
+    column_type = column.type
+
+    if isinstance(column_type, Enum) and column_type.enum_class is not None:
+        value = _enum_value(column, column_type.enum_class)
+    elif isinstance(column_type, ARRAY) and isinstance(column_type.item_type, Enum):
+        value = _enum_array(column, column_type.item_type.enum_class)
+    elif isinstance(column_type, Numeric) and not isinstance(column_type, Float):
+        value = cast(column, Text)
+    elif isinstance(column_type, DateTime):
+        value = _timestamp(column)
+    else:
+        value = column
+
+    if isinstance(column_type, ARRAY) and not _nullable(field.annotation):
+        # List[...] = [] fields render NULL arrays as []
+        value = func.coalesce(func.to_json(value), EMPTY_JSON_ARRAY)
+
+    return value
+
+
+def json_object(model, schema, **nested):
+    """json_build_object() with the keys of `schema`, read from `model` columns"""
+    arguments = []
+    for name, field in schema.model_fields.items():
+        value = nested[name] if name in nested else _json_value(getattr(model, name), field)
+        arguments += [_sql_string(name), value]
+    return func.json_build_object(*arguments)
+
+
+def _json_list(model, schema, parent_column, parent_key, *joins, **nested):
+    """LATERAL subquery aggregating `model` rows of one parent into a JSON array"""
+    stmt = select(
+        func.coalesce(
+            func.json_agg(
+                aggregate_order_by(
+                    json_object(model, schema, **nested),
+                    model.created_at,
+                    model.id,
+                )
+            ),
+            EMPTY_JSON_ARRAY,
+        ).label("agg")
+    ).select_from(model)
+
+    for target, onclause, outer in joins:
+        stmt = stmt.join(target, onclause, isouter=outer)
+
+    return stmt.where(parent_column == parent_key).lateral()
+
+
+def destination_details_json(*columns):
+    """
+    Select `columns` plus `details`, the JSON text of DestinationFullDetails,
+    for every destination matching the caller's where clause.
+    """
+    attraction_images = _json_list(
+        AttractionImage, AttractionImageDetails,
+        AttractionImage.attraction_id, Attraction.id,
+    )
+    attractions = _json_list(
+        Attraction, AttractionDetails,
+        Attraction.destination_id, Destination.id,
+        (attraction_images, true(), False),
+        images=attraction_images.c.agg,
+    )
+    images = _json_list(
+        DestinationImage, DestinationImageDetails,
+        DestinationImage.destination_id, Destination.id,
+    )
+    transportation_options = _json_list(
+        DestinationTransportOption, TransportOptionDetails,
+        DestinationTransportOption.destination_id, Destination.id,
+        (TransportTypeRef, TransportTypeRef.id == DestinationTransportOption.transport_ref_id, False),
+        transport_ref=json_object(TransportTypeRef, TransportRefDetails),
+    )
+    signature_dishes = _json_list(
+        SignatureDish, SignatureDishResponse,
+        SignatureDish.destination_id, Destination.id,
+    )
+    accommodation_types = _json_list(
+        DestinationAccommodationType, AccommodationTypeDetails,
+        DestinationAccommodationType.destination_id, Destination.id,
+        (AccommodationTypeRef, AccommodationTypeRef.id == DestinationAccommodationType.type_ref_id, False),
+        type_ref=json_object(AccommodationTypeRef, AccommodationTypeRefDetails),
+    )
+    accommodations = _json_list(
+        Accommodation, AccommodationDetails,
+        Accommodation.destination_id, Destination.id,
+        (DestinationAccommodationType, DestinationAccommodationType.id == Accommodation.accommodation_type_id, True),
+        (AccommodationTypeRef, AccommodationTypeRef.id == DestinationAccommodationType.type_ref_id, True),
+        accommodation_type=case(
+            (DestinationAccommodationType.id.is_(None), None),
+            else_=json_object(
+                DestinationAccommodationType,
+                AccommodationTypeForAccommodation,
+                type_ref=json_object(AccommodationTypeRef, AccommodationTypeRefDetails),
+            ),
+        ),
+    )
+    activities = _json_list(
+        DestinationActivity, ActivityDetails,
+        DestinationActivity.destination_id, Destination.id,
+        (ActivityTypeRef, ActivityTypeRef.id == DestinationActivity.activity_ref_id, False),
+        activity_ref=json_object(ActivityTypeRef, ActivityRefDetails),
+    )
+
+    details = json_object(
+        Destination,
+        DestinationFullDetails,
+        images=images.c.agg,
+        attractions=attractions.c.agg,
+        transportation_options=transportation_options.c.agg,
+        signature_dishes=signature_dishes.c.agg,
+        accommodation_types=accommodation_types.c.agg,
+        accommodations=accommodations.c.agg,
+        activities=activities.c.agg,
+    )
+
+    stmt = select(*columns, cast(details, Text).label("details")).select_from(Destination)
+
+    for lateral in (
+        images,
+        attractions,
+        transportation_options,
+        signature_dishes,
+        accommodation_types,
+        accommodations,
+        activities,
+    ):
+        stmt = stmt.join(lateral, true())
+
+    return stmt
@@ -0,0 +1,237 @@
+"""
+DestinationFullDetails built from Core rows.
+
+One SELECT per collection for a whole batch of destinations, fetched as row
+mappings (no identity map, no instrumented attributes) and grouped into the
+plain dicts the pydantic schemas expect, so validation reads dict keys
+instead of walking ORM attributes through `from_attributes`.
+
+Only the columns a schema renders are selected. Columns of joined reference
+rows are labelled with their dotted path in the document ("type_ref.name")
+and nested back by `_build`, with the plan worked out once per result.
+Collections are ordered by creation time, as in the json engine.
+"""
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from destination.db.models import (
+    Destination,
+    AccommodationTypeRef,
+    DestinationAccommodationType,
+    Accommodation,
+    TransportTypeRef,
+    DestinationTransportOption,
+    ActivityTypeRef,
+    DestinationActivity,
+    SignatureDish,
+    Attraction,
+    DestinationImage,
+    AttractionImage,
+)
+from destination.schemas.details import (
+    AttractionImageDetails,
+    DestinationImageDetails,
+    AttractionDetails,
+    AccommodationTypeRefDetails,
+    AccommodationTypeDetails,
+    AccommodationTypeForAccommodation,
+    AccommodationDetails,
+    TransportRefDetails,
+    TransportOptionDetails,
+    ActivityRefDetails,
+    ActivityDetails,
+    SignatureDishResponse,
+    DestinationFullDetails,
+)
+
+# labels the destination's document columns apart from those the etag needs
+DETAILS_PREFIX = "details."
+
+COLLECTIONS = (
+    "images",
+    "attractions",
+    "transportation_options",
+    "signature_dishes",
+    "accommodation_types",
+    "accommodations",
+    "activities",
+)
+
+
+def _fields(model, schema, prefix: str = "") -> list:
+    """Columns of `model` that `schema` renders, labelled with their document path"""
+    table = model.__table__
+    return [
+        table.c[name].label(prefix + name)
+        for name in schema.model_fields
+        if name in table.c
+    ]
+
+
+def _shape(keys, prefix: str = "") -> tuple:
+    """
+    Nesting plan for a result's dotted labels under `prefix`, worked out once
+    per result: ([(name, position)], [(name, id position, nested plan)]).
+    """
+    fields, nested = [], []
+    for position, key in enumerate(keys):
+        if not key.startswith(prefix):
+            continue
+        name, _, rest = key[len(prefix):].partition(".")
+        if not rest:
+            fields.append((name, position))
+        elif name not in nested:
+            nested.append(name)
+
+    children = []
+    for name in nested:
+        shape = _shape(keys, f"{prefix}{name}.")
+        children.append((name, dict(shape[0])["id"], shape))
+    return fields, children
+
+
+def _build(row, shape) -> dict:
+    """Nested dict of one row; a nested object with a NULL id (outer join miss) is None"""
+    fields, children = shape
+    item = {name: row[position] for name, position in fields}
+    for name, id_position, nested in children:
+        item[name] = _build(row, nested) if row[id_position] is not None else None
+    return item
+
+
+def _destinations(destination_ids):
+    return (
+        select(
+            Destination.id,
+            Destination.slug,
+            Destination.updated_at,
+            Destination.child_version,
+            *_fields(Destination, DestinationFullDetails, DETAILS_PREFIX),
+        )
+        .where(Destination.id.in_(destination_ids))
+    )
+
+
+def _collections(destination_ids) -> dict:
+    """key -> SELECT of that collection's rows, each with its destination_id"""
+    return {
+        "images": (
+            select(DestinationImage.destination_id, *_fields(DestinationImage, DestinationImageDetails))
+            .where(DestinationImage.destination_id.in_(destination_ids))
+            .order_by(DestinationImage.created_at, DestinationImage.id)
+        ),
+        "attractions": (
+            select(Attraction.destination_id, *_fields(Attraction, AttractionDetails))
+            .where(Attraction.destination_id.in_(destination_ids))
+            .order_by(Attraction.created_at, Attraction.id)
+        ),
+        "transportation_options": (
+            select(
+                DestinationTransportOption.destination_id,
+                *_fields(DestinationTransportOption, TransportOptionDetails),
+                *_fields(TransportTypeRef, TransportRefDetails, "transport_ref."),
+            )
+            .join(TransportTypeRef, TransportTypeRef.id == DestinationTransportOption.transport_ref_id)
+            .where(DestinationTransportOption.destination_id.in_(destination_ids))
+            .order_by(DestinationTransportOption.created_at, DestinationTransportOption.id)
+        ),
+        "signature_dishes": (
+            select(SignatureDish.destination_id, *_fields(SignatureDish, SignatureDishResponse))
+            .where(SignatureDish.destination_id.in_(destination_ids))
+            .order_by(SignatureDish.created_at, SignatureDish.id)
+        ),
+        "accommodation_types": (
+            select(
+                DestinationAccommodationType.destination_id,
+                *_fields(DestinationAccommodationType, AccommodationTypeDetails),
+                *_fields(AccommodationTypeRef, AccommodationTypeRefDetails, "type_ref."),
+            )
+            .join(AccommodationTypeRef, AccommodationTypeRef.id == DestinationAccommodationType.type_ref_id)
+            .where(DestinationAccommodationType.destination_id.in_(destination_ids))
+            .order_by(DestinationAccommodationType.created_at, DestinationAccommodationType.id)
+        ),
+        "accommodations": (
+            select(
+                Accommodation.destination_id,
+                *_fields(Accommodation, AccommodationDetails),
+                *_fields(DestinationAccommodationType, AccommodationTypeForAccommodation, "accommodation_type."),
+                *_fields(AccommodationTypeRef, AccommodationTypeRefDetails, "accommodation_type.type_ref."),
+            )
+            .outerjoin(DestinationAccommodationType, DestinationAccommodationType.id == Accommodation.accommodation_type_id)
+            .outerjoin(AccommodationTypeRef, AccommodationTypeRef.id == DestinationAccommodationType.type_ref_id)
+            .where(Accommodation.destination_id.in_(destination_ids))
+            .order_by(Accommodation.created_at, Accommodation.id)
+        ),
+        "activities": (
+            select(
+                DestinationActivity.destination_id,
+                *_fields(DestinationActivity, ActivityDetails),
+                *_fields(ActivityTypeRef, ActivityRefDetails, "activity_ref."),
+            )
+            .join(ActivityTypeRef, ActivityTypeRef.id == DestinationActivity.activity_ref_id)
+            .where(DestinationActivity.destination_id.in_(destination_ids))
+            .order_by(DestinationActivity.created_at, DestinationActivity.id)
+        ),
+    }
+
+
+def _attraction_images(destination_ids):
+    """SELECT of the destinations' attraction images, each with its attraction_id"""
+    return (
+        select(AttractionImage.attraction_id, *_fields(AttractionImage, AttractionImageDetails))
+        .join(Attraction, Attraction.id == AttractionImage.attraction_id)
+        .where(Attraction.destination_id.in_(destination_ids))
+        .order_by(AttractionImage.created_at, AttractionImage.id)
+    )
+
+
+async def load_details_rows(db: AsyncSession, destination_ids) -> List[tuple]:
+    """
+    Load the given destinations as (row, details) pairs: `row` carries id,
+    slug, updated_at and child_version (enough for destination_etag) and
+    `details` is the DestinationFullDetails dict.
+    """
+    result = await db.execute(_destinations(list(destination_ids)))
+
+    loaded = []
+    documents: Dict[UUID, dict] = {}
+    shape = _shape(result.keys(), DETAILS_PREFIX)
+    for row in result.all():
+        details = _build(row, shape)
+        for key in COLLECTIONS:
+            details[key] = []
+        documents[row.id] = details
+        loaded.append((row, details))
+
+    if not loaded:
+        return []
+
+    attractions: Dict[UUID, dict] = {}
+    for key, stmt in _collections(list(documents)).items():
+        result = await db.execute(stmt)
+        shape = _shape(result.keys())
+        items = [_build(row, shape) for row in result.all()]
+        for item in items:
+            documents[item.pop("destination_id")][key].append(item)
+
+        if key == "attractions":
+            for item in items:
+                item["images"] = []
+                attractions[item["id"]] = item
+
+    if attractions:
+        result = await db.execute(_attraction_images(list(documents)))
+        shape = _shape(result.keys())
+        for row in result.all():
+            item = _build(row, shape)
+            attractions[item.pop("attraction_id")]["images"].append(item)
+
+    return loaded
+
+
+def render_details(details: dict) -> str:
+    """JSON text of a details dict, as DestinationFullDetails.model_dump_json() renders it"""
+    return DestinationFullDetails.model_validate(details).model_dump_json()
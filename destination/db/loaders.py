@@ -0,0 +1,41 @@
+"""
+Loader option sets for the destination graph.
+
+Every relationship in destination.db.models is declared with `lazy="raise"`
+(collections) or `lazy="raise_on_sql"` (many-to-one), so touching anything
+that was not loaded up front raises instead of issuing a hidden query. Each
+CRUD method picks one of the graphs below, or loads plain columns.
+"""
+from sqlalchemy.orm import selectinload
+
+from destination.db.models import (
+    Destination,
+    DestinationAccommodationType,
+    Accommodation,
+    DestinationTransportOption,
+    DestinationActivity,
+    Attraction,
+)
+
+
+# everything DestinationFullDetails renders
+DESTINATION_DETAILS_GRAPH = (
+    selectinload(Destination.images),
+    selectinload(Destination.attractions)
+    .selectinload(Attraction.images),  # Load attraction images
+    selectinload(Destination.signature_dishes),
+    selectinload(Destination.transportation_options)
+    .selectinload(DestinationTransportOption.transport_ref),  # Load transport name
+    selectinload(Destination.activities)
+    .selectinload(DestinationActivity.activity_ref),  # Load activity name
+    selectinload(Destination.accommodations)
+    .selectinload(Accommodation.accommodation_type)
+    .selectinload(DestinationAccommodationType.type_ref),  # Load accommodation type name
+    selectinload(Destination.accommodation_types)
+    .selectinload(DestinationAccommodationType.type_ref),  # Load accommodation type name
+)
+
+# DestinationDetailsResponse, returned from create
+DESTINATION_CREATED_GRAPH = (
+    selectinload(Destination.attractions),
+)
@@ -4,12 +4,13 @@ from datetime import datetime, timezone
 
 from sqlalchemy import (
     Column, Enum, String, DateTime, Boolean,
-    Text, Integer, DECIMAL, ForeignKey, ARRAY
+    Text, Integer, Float, BigInteger, DECIMAL, ForeignKey, ARRAY, Index, DDL, event
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR, JSONB
+from sqlalchemy.orm import relationship, deferred
 
 from app.db.base import Base
+from app.utils.geo import point_geohash
 
 
 class CostLevel(str, enum.Enum):
@@ -40,7 +41,7 @@ class AccommodationTypeRef(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     
     # FIXED: Changed relationship name to match back_populates
-    destination_types = relationship("DestinationAccommodationType", back_populates="type_ref")
+    destination_types = relationship("DestinationAccommodationType", back_populates="type_ref", lazy="raise")
 
 
 class DestinationAccommodationType(Base):
@@ -61,9 +62,10 @@ class DestinationAccommodationType(Base):
     # Relationships
     destination = relationship(
         "Destination",
-        back_populates="accommodation_types"
+        back_populates="accommodation_types",
+        lazy="raise_on_sql",
     )
-    type_ref = relationship("AccommodationTypeRef", back_populates="destination_types")
+    type_ref = relationship("AccommodationTypeRef", back_populates="destination_types", lazy="raise_on_sql")
 
 
 class Accommodation(Base):
@@ -83,6 +85,7 @@ class Accommodation(Base):
     region = Column(String(255), nullable=False, index=True)
     longitude = Column(DECIMAL(10, 7))
     latitude = Column(DECIMAL(10, 7))
+    geohash = Column(String(12, collation="C"), index=True)  # see set_geohash below
     
     # Contact
     phone = Column(String(20))
@@ -92,8 +95,8 @@ class Accommodation(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
-    destination = relationship("Destination", back_populates="accommodations")
-    accommodation_type = relationship("DestinationAccommodationType")
+    destination = relationship("Destination", back_populates="accommodations", lazy="raise_on_sql")
+    accommodation_type = relationship("DestinationAccommodationType", lazy="raise_on_sql")
 
 
 # Transportations
@@ -108,7 +111,7 @@ class TransportTypeRef(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     
     # FIXED: Changed relationship name to match back_populates
-    destination_transports = relationship("DestinationTransportOption", back_populates="transport_ref")
+    destination_transports = relationship("DestinationTransportOption", back_populates="transport_ref", lazy="raise")
 
 
 class DestinationTransportOption(Base):
@@ -129,9 +132,10 @@ class DestinationTransportOption(Base):
     # Relationships
     destination = relationship(
         "Destination",
-        back_populates="transportation_options"
+        back_populates="transportation_options",
+        lazy="raise_on_sql",
     )
-    transport_ref = relationship("TransportTypeRef", back_populates="destination_transports")
+    transport_ref = relationship("TransportTypeRef", back_populates="destination_transports", lazy="raise_on_sql")
 
 
 # Activity
@@ -147,7 +151,7 @@ class ActivityTypeRef(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     
     # Relationships
-    destination_activities = relationship("DestinationActivity", back_populates="activity_ref")
+    destination_activities = relationship("DestinationActivity", back_populates="activity_ref", lazy="raise")
 
 
 class DestinationActivity(Base):
@@ -172,9 +176,10 @@ class DestinationActivity(Base):
     # Relationships
     destination = relationship(
         "Destination",
-        back_populates="activities"
+        back_populates="activities",
+        lazy="raise_on_sql",
     )
-    activity_ref = relationship("ActivityTypeRef", back_populates="destination_activities")
+    activity_ref = relationship("ActivityTypeRef", back_populates="destination_activities", lazy="raise_on_sql")
 
 
 
@@ -206,7 +211,7 @@ class SignatureDish(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     
     # Relationships
-    destination = relationship("Destination", back_populates="signature_dishes")
+    destination = relationship("Destination", back_populates="signature_dishes", lazy="raise_on_sql")
 
 
 class Restaurant(Base):
@@ -226,6 +231,7 @@ class Restaurant(Base):
     region = Column(String(255), nullable=False, index=True)
     longitude = Column(DECIMAL(10, 7))
     latitude = Column(DECIMAL(10, 7))
+    geohash = Column(String(12, collation="C"), index=True)  # see set_geohash below
     
     # Contact
     phone = Column(String(20))
@@ -238,7 +244,7 @@ class Restaurant(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
-    destination = relationship("Destination", back_populates="restaurants")
+    destination = relationship("Destination", back_populates="restaurants", lazy="raise_on_sql")
 
 
 # Attractions
@@ -263,15 +269,18 @@ class Attraction(Base):
     region = Column(String(255), nullable=False, index=True)
     longitude = Column(DECIMAL(10, 7))
     latitude = Column(DECIMAL(10, 7))
+    geohash = Column(String(12, collation="C"), index=True)  # see set_geohash below
     
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
-    destination = relationship("Destination", back_populates="attractions")
+    destination = relationship("Destination", back_populates="attractions", lazy="raise_on_sql")
     images = relationship(
         "AttractionImage",
         back_populates="attraction",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
@@ -288,7 +297,7 @@ class DestinationImage(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
 
     # relationship
-    destination = relationship("Destination", back_populates="images")
+    destination = relationship("Destination", back_populates="images", lazy="raise_on_sql")
 
 
 
@@ -305,13 +314,33 @@ class AttractionImage(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
 
     # relationship
-    attraction = relationship("Attraction", back_populates="images")
+    attraction = relationship("Attraction", back_populates="images", lazy="raise_on_sql")
 
 
 
 # Destination
 class Destination(Base):
     __tablename__ = "destinations"
+    __table_args__ = (
+        # keyset pagination key for the list endpoint
+        Index("ix_destinations_created_at_id", "created_at", "id"),
+        # full-text + typo tolerant search (see SEARCH_VECTOR_TRIGGER below)
+        Index("ix_destinations_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_destinations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # containment (@>) filters for the list facets
+        Index("ix_destinations_tags", "tags", postgresql_using="gin"),
+        Index("ix_destinations_suitable_for", "suitable_for", postgresql_using="gin"),
+        Index("ix_destinations_popular_for", "popular_for", postgresql_using="gin"),
+        # slug LIKE 'base-%' prefix lookups when allocating slugs
+        Index("ix_destinations_slug_pattern", "slug", postgresql_ops={"slug": "text_pattern_ops"}),
+        # keyset pagination key for sort=trending
+        Index("ix_destinations_trending_score_id", "trending_score", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     slug = Column(String(255), unique=True, index=True, nullable=False)
@@ -333,6 +362,7 @@ class Destination(Base):
     region = Column(String(255), nullable=False, index=True)
     longitude = Column(DECIMAL(10, 7))
     latitude = Column(DECIMAL(10, 7))
+    geohash = Column(String(12, collation="C"), index=True)  # see set_geohash below
     timezone = Column(String(50), default="UTC")
 
     # Visit Info
@@ -351,6 +381,17 @@ class Destination(Base):
     is_active = Column(Boolean, default=True, index=True)
     is_featured = Column(Boolean, default=False, index=True)
     view_count = Column(Integer, default=0)
+
+    # Ranking - maintained by tasks.destination.rank_destinations
+    trending_score = Column(Float, default=0, server_default="0", nullable=False)
+    decayed_views = Column(Float, default=0, server_default="0", nullable=False)
+    ranked_view_count = Column(Integer, default=0, server_default="0", nullable=False)
+    ranked_at = Column(DateTime(timezone=True))
+
+    child_version = Column(Integer, default=0, nullable=False)  # bumped when child collections change
+
+    # Search - maintained by the destinations_search_vector_update() trigger
+    search_vector = deferred(Column(TSVECTOR))
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -361,21 +402,29 @@ class Destination(Base):
         "DestinationAccommodationType",
         back_populates="destination",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     transportation_options = relationship(
         "DestinationTransportOption",
         back_populates="destination",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     activities = relationship(
         "DestinationActivity",
         back_populates="destination",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     signature_dishes = relationship(
         "SignatureDish",
         back_populates="destination",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     
     # Relationships - Destination-specific entities
@@ -383,22 +432,107 @@ class Destination(Base):
         "DestinationImage",
         back_populates="destination",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise",
     )
     accommodations = relationship(
         "Accommodation",
         back_populates="destination",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise",
     )
     attractions = relationship(
         "Attraction",
         back_populates="destination",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise",
     )
     restaurants = relationship(
         "Restaurant",
         back_populates="destination",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
+
+
+# Materialized details documents
+class DestinationDocument(Base):
+    """Pre-serialized DestinationFullDetails, rebuilt whenever the destination or its children change"""
+    __tablename__ = "destination_documents"
+
+    destination_id = Column(UUID(as_uuid=True), ForeignKey("destinations.id", ondelete="CASCADE"), primary_key=True)
+    slug = Column(String(255), unique=True, index=True, nullable=False)
+    document = Column(JSONB, nullable=False)
+    etag = Column(String(64), nullable=False)  # from destination updated_at + child_version
+
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+
+# Catalog versions
+REFERENCE_TYPES_VERSION = "reference_types"
+DESTINATIONS_VERSION = "destinations"
+ATTRACTIONS_VERSION = "attractions"
+
+
+class CatalogVersion(Base):
+    """
+    Monotonic version counters. Bumped in the same transaction as the data
+    they cover, except `destinations`, which every destination write touches
+    and is bumped right after commit (CatalogVersionCRUD.bump_committed).
+    """
+    __tablename__ = "catalog_versions"
+
+    name = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+
+# Search vector maintenance
+# name > tags > region/country > description, all with the same text search config
+SEARCH_CONFIG = "english"
+
+SEARCH_VECTOR_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION destinations_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(array_to_string(NEW.tags, ' '), '')), 'B') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.region, '') || ' ' || coalesce(NEW.country, '')), 'C') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.description, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER destinations_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, tags, region, country, description ON destinations
+FOR EACH ROW EXECUTE FUNCTION destinations_search_vector_update()
+"""
+
+# keep Base.metadata.create_all (init_db) in line with the alembic migration
+event.listen(
+    Destination.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+event.listen(Destination.__table__, "after_create", DDL(SEARCH_VECTOR_FUNCTION))
+event.listen(Destination.__table__, "after_create", DDL(SEARCH_VECTOR_TRIGGER))
+
+
+# Geohash of the stored coordinates, the spatial index behind the nearby
+# queries (C collation so prefix lookups are plain btree range scans).
+# Maintained on every ORM write; bulk Core inserts must set it themselves.
+GEO_MODELS = (Destination, Attraction, Accommodation, Restaurant)
+
+
+def set_geohash(mapper, connection, target):
+    target.geohash = point_geohash(target.latitude, target.longitude)
+
+
+for _model in GEO_MODELS:
+    event.listen(_model, "before_insert", set_geohash)
+    event.listen(_model, "before_update", set_geohash)
@@ -0,0 +1,33 @@
+from typing import Tuple
+
+from app.core.config import get_settings
+from app.utils.cache import TieredCache
+
+settings = get_settings()
+
+# slug -> etag + serialized DestinationFullDetails (JSON bytes), see pack_details
+destination_details_cache = TieredCache(
+    name="destination:details",
+    local_size=settings.destination_cache_local_size,
+    local_ttl=settings.destination_cache_local_ttl,
+    redis_ttl=settings.destination_cache_redis_ttl,
+)
+
+# slugs with no destination, so repeated bad slugs skip Postgres. Creates
+# delete the entry; other processes may answer 404 for up to local_ttl.
+destination_missing_slugs = TieredCache(
+    name="destination:missing",
+    local_size=settings.destination_missing_slug_cache_size,
+    local_ttl=settings.destination_cache_local_ttl,
+    redis_ttl=settings.destination_missing_slug_ttl,
+)
+MISSING = b"1"
+
+
+def pack_details(etag: str, payload: bytes) -> bytes:
+    return etag.encode() + b"\n" + payload
+
+
+def unpack_details(entry: bytes) -> Tuple[str, bytes]:
+    etag, _, payload = entry.partition(b"\n")
+    return etag.decode(), payload
@@ -0,0 +1,248 @@
+import math
+import time
+import asyncio
+from uuid import UUID
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select, cast, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.utils.geo import EARTH_RADIUS_M, METERS_PER_DEGREE, cell_size
+
+from destination.db.crud import CatalogVersionCRUD
+from destination.db.models import Attraction, ATTRACTIONS_VERSION
+
+settings = get_settings()
+logger = setup_logging()
+
+# grid of precision-6 geohash sized cells (~1.2km x 0.6km), numbered row-major
+LAT_STEP, LNG_STEP = cell_size(6)
+ROWS = round(180.0 / LAT_STEP)
+COLS = round(360.0 / LNG_STEP)
+
+
+def _cell(latitude: float, longitude: float) -> Tuple[int, int]:
+    row = min(max(math.floor((latitude + 90.0) / LAT_STEP), 0), ROWS - 1)
+    col = math.floor((longitude + 180.0) / LNG_STEP) % COLS
+    return row, col
+
+
+def _keys(latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    rows = np.clip(np.floor((latitude + 90.0) / LAT_STEP), 0, ROWS - 1).astype(np.int64)
+    cols = (np.floor((longitude + 180.0) / LNG_STEP) % COLS).astype(np.int64)
+    return rows * COLS + cols
+
+
+class AttractionGeoIndex:
+    """
+    Process-wide spatial index of every attraction with coordinates, for the
+    geofence checks on the location update path (no DB round trip).
+
+    Attractions are kept sorted by grid cell in parallel NumPy arrays, so a
+    check is one searchsorted per grid row the circle spans and one
+    vectorised haversine over the candidates.
+
+    Writes made through this process are applied incrementally (`add`,
+    `remove_destination`). Every writer bumps the `attractions` catalog
+    version; readers compare it at most every
+    `attraction_index_check_interval` seconds and reload in full when
+    another process moved it.
+    """
+
+    def __init__(self):
+        self._keys = np.empty(0, dtype=np.int64)  # row * COLS + col, sorted
+        self._lat = np.empty(0)  # radians
+        self._lng = np.empty(0)  # radians
+        self._cos_lat = np.empty(0)
+        self._ids: List[UUID] = []
+        self._destination_ids: List[UUID] = []
+        self._names: List[str] = []
+        self._members: Set[UUID] = set()
+
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def load(self, db: AsyncSession) -> None:
+        async with self._lock:
+            version = await CatalogVersionCRUD(db).get(ATTRACTIONS_VERSION)
+            result = await db.execute(
+                select(
+                    Attraction.id,
+                    Attraction.destination_id,
+                    Attraction.name,
+                    cast(Attraction.latitude, Float),
+                    cast(Attraction.longitude, Float),
+                )
+                .where(Attraction.latitude.is_not(None), Attraction.longitude.is_not(None))
+            )
+            rows = result.all()
+
+            self._store(*zip(*rows) if rows else ((),) * 5)
+            self._version = version
+            self._checked_at = time.monotonic()
+
+        logger.info(f"Attraction geo index loaded ({len(rows)} attractions, version {version})")
+
+    def _store(self, ids, destination_ids, names, latitude, longitude, keep: bool = False) -> None:
+        """Replace the index with the given attractions, or merge them in with `keep`"""
+        latitude = np.array(latitude, dtype=float)
+        longitude = np.array(longitude, dtype=float)
+        keys = _keys(latitude, longitude)
+        latitude, longitude = np.radians(latitude), np.radians(longitude)
+        cos_lat = np.cos(latitude)
+        ids, destination_ids, names = list(ids), list(destination_ids), list(names)
+        members = self._members | set(ids) if keep else set(ids)
+
+        if keep:
+            keys = np.concatenate((self._keys, keys))
+            latitude = np.concatenate((self._lat, latitude))
+            longitude = np.concatenate((self._lng, longitude))
+            cos_lat = np.concatenate((self._cos_lat, cos_lat))
+            ids = self._ids + ids
+            destination_ids = self._destination_ids + destination_ids
+            names = self._names + names
+
+        order = np.argsort(keys, kind="stable")
+
+        # swapped together, readers never see a half-built index
+        (
+            self._keys, self._lat, self._lng, self._cos_lat,
+            self._ids, self._destination_ids, self._names, self._members,
+        ) = (
+            keys[order],
+            latitude[order],
+            longitude[order],
+            cos_lat[order],
+            np.array(ids, dtype=object)[order].tolist(),
+            np.array(destination_ids, dtype=object)[order].tolist(),
+            np.array(names, dtype=object)[order].tolist(),
+            members,
+        )
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Reload if another process changed attractions since the last check"""
+        if self._version is None:
+            return await self.load(db)
+
+        if time.monotonic() - self._checked_at < settings.attraction_index_check_interval:
+            return
+
+        self._checked_at = time.monotonic()
+        if await CatalogVersionCRUD(db).get(ATTRACTIONS_VERSION) != self._version:
+            await self.load(db)
+
+    def add(self, attractions: Iterable[Tuple[UUID, UUID, str, float, float]]) -> None:
+        """Insert or move (id, destination_id, name, latitude, longitude) entries"""
+        rows = [
+            (attraction_id, destination_id, name, float(latitude), float(longitude))
+            for attraction_id, destination_id, name, latitude, longitude in attractions
+            if latitude is not None and longitude is not None
+        ]
+        if not rows:
+            return
+
+        self.remove([row[0] for row in rows])
+        self._store(*zip(*rows), keep=True)
+
+    def remove(self, attraction_ids: Iterable[UUID]) -> None:
+        self._delete({*attraction_ids}, self._ids)
+
+    def remove_destination(self, destination_id: UUID) -> None:
+        self._delete({destination_id}, self._destination_ids)
+
+    def applied(self, version: int) -> None:
+        """
+        Record the catalog version after this process applied its own write.
+        Anything but the next version means another process wrote too, so
+        the index is left stale and reloads on the next sync.
+        """
+        if self._version is not None and version == self._version + 1:
+            self._version = version
+
+    def _delete(self, values: set, column: List[UUID]) -> None:
+        if column is self._ids:
+            values &= self._members
+            if not values:
+                return
+
+        positions = [i for i, value in enumerate(column) if value in values]
+        if not positions:
+            return
+
+        self._members = self._members - {self._ids[i] for i in positions}
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[positions] = False
+        self._keys = self._keys[keep]
+        self._lat = self._lat[keep]
+        self._lng = self._lng[keep]
+        self._cos_lat = self._cos_lat[keep]
+        self._ids = [value for value, kept in zip(self._ids, keep) if kept]
+        self._destination_ids = [value for value, kept in zip(self._destination_ids, keep) if kept]
+        self._names = [value for value, kept in zip(self._names, keep) if kept]
+
+    def _candidates(self, latitude: float, longitude: float, radius_m: float) -> np.ndarray:
+        """Positions of attractions in grid cells overlapping the circle's bounding box"""
+        d_lat = radius_m / METERS_PER_DEGREE
+        first_row = _cell(latitude - d_lat, longitude)[0]
+        last_row = _cell(latitude + d_lat, longitude)[0]
+
+        # widest longitude span is at the pole-ward edge of the box
+        edge = min(90.0, abs(latitude) + d_lat)
+        cos_edge = math.cos(math.radians(edge))
+        if cos_edge * 180.0 * METERS_PER_DEGREE <= radius_m:
+            spans = [(0, COLS - 1)]
+        else:
+            d_lng = radius_m / (METERS_PER_DEGREE * cos_edge)
+            first_col = _cell(latitude, longitude - d_lng)[1]
+            last_col = _cell(latitude, longitude + d_lng)[1]
+            if first_col <= last_col:
+                spans = [(first_col, last_col)]
+            else:  # crosses the antimeridian
+                spans = [(0, last_col), (first_col, COLS - 1)]
+
+        lower, upper = [], []
+        for row in range(first_row, last_row + 1):
+            for first_col, last_col in spans:
+                lower.append(row * COLS + first_col)
+                upper.append(row * COLS + last_col + 1)
+
+        starts = np.searchsorted(self._keys, lower)
+        ends = np.searchsorted(self._keys, upper)
+        return np.concatenate([np.arange(s, e) for s, e in zip(starts, ends) if e > s] or [np.empty(0, dtype=np.int64)])
+
+    def within(self, latitude: float, longitude: float, radius_m: float) -> List[dict]:
+        """Attractions within radius_m of the point, closest first"""
+        candidates = self._candidates(latitude, longitude, radius_m)
+        if not candidates.size:
+            return []
+
+        phi = math.radians(latitude)
+        lam = math.radians(longitude)
+        a = (
+            np.sin((self._lat[candidates] - phi) / 2) ** 2
+            + math.cos(phi) * self._cos_lat[candidates] * np.sin((self._lng[candidates] - lam) / 2) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+        inside = np.flatnonzero(distances <= radius_m)
+        inside = inside[np.argsort(distances[inside], kind="stable")]
+
+        return [
+            {
+                "id": self._ids[position],
+                "destination_id": self._destination_ids[position],
+                "name": self._names[position],
+                "distance_m": float(distances[i]),
+            }
+            for i, position in zip(inside, candidates[inside])
+        ]
+
+
+attraction_geo_index = AttractionGeoIndex()
@@ -0,0 +1,101 @@
+import time
+import asyncio
+from uuid import UUID
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.utils.etag import make_etag
+
+from destination.db.crud import (
+    AccommodationCRUD,
+    TransportCRUD,
+    ActivityCRUD,
+    CatalogVersionCRUD,
+)
+from destination.db.models import REFERENCE_TYPES_VERSION
+from destination.schema import (
+    AccommodationTypeDetails,
+    TransportTypeDetails,
+    ActivityTypeDetails,
+)
+
+settings = get_settings()
+logger = setup_logging()
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """Immutable view of the accommodation/transport/activity reference tables"""
+    version: int
+    accommodation_types: Tuple[AccommodationTypeDetails, ...] = ()
+    transport_types: Tuple[TransportTypeDetails, ...] = ()
+    activity_types: Tuple[ActivityTypeDetails, ...] = ()
+
+    accommodation_type_ids: FrozenSet[UUID] = field(init=False)
+    transport_type_ids: FrozenSet[UUID] = field(init=False)
+    activity_type_ids: FrozenSet[UUID] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "accommodation_type_ids", frozenset(t.id for t in self.accommodation_types))
+        object.__setattr__(self, "transport_type_ids", frozenset(t.id for t in self.transport_types))
+        object.__setattr__(self, "activity_type_ids", frozenset(t.id for t in self.activity_types))
+
+    def etag(self, kind: str) -> str:
+        return make_etag(REFERENCE_TYPES_VERSION, kind, self.version)
+
+
+class ReferenceRegistry:
+    """
+    Process-wide snapshot of the reference type tables.
+
+    Loaded at startup and swapped as a whole, never mutated in place. Writers
+    bump the `reference_types` catalog version in their transaction; readers
+    compare it against the snapshot at most every
+    `reference_registry_check_interval` seconds and reload when it moved.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> ReferenceSnapshot:
+        async with self._lock:
+            version = await CatalogVersionCRUD(db).get(REFERENCE_TYPES_VERSION)
+            snapshot = ReferenceSnapshot(
+                version=version,
+                accommodation_types=tuple(await AccommodationCRUD(db).accommodation_type_list()),
+                transport_types=tuple(await TransportCRUD(db).transport_type_list()),
+                activity_types=tuple(await ActivityCRUD(db).activity_type_list()),
+            )
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+
+        logger.info(f"Reference registry loaded (version {snapshot.version})")
+        return snapshot
+
+    async def get(self, db: AsyncSession, refresh: bool = False) -> ReferenceSnapshot:
+        """
+        The current snapshot. `refresh` checks the catalog version now
+        instead of waiting out the check interval.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return await self.load(db)
+
+        if not refresh and time.monotonic() - self._checked_at < settings.reference_registry_check_interval:
+            return snapshot
+
+        self._checked_at = time.monotonic()
+        version = await CatalogVersionCRUD(db).get(REFERENCE_TYPES_VERSION)
+        if version != snapshot.version:
+            return await self.load(db)
+
+        return snapshot
+
+
+reference_registry = ReferenceRegistry()
@@ -0,0 +1,109 @@
+import re
+import time
+from typing import Awaitable, Callable, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.redis import get_redis
+
+settings = get_settings()
+logger = setup_logging()
+
+# slug -> views not yet written to destinations.view_count
+PENDING_KEY = "views:destinations:pending"
+# the batch a flush is currently writing (left behind if the flush failed)
+FLUSHING_KEY = "views:destinations:flushing"
+# slug -> destinations.view_count as of the last flush
+TOTALS_KEY = "views:destinations:totals"
+FLUSH_LOCK_KEY = "views:destinations:flush-lock"
+
+# DestinationFullDetails has a single view_count key, on the destination itself
+VIEW_COUNT_PATTERN = re.compile(rb'("view_count"\s*:\s*)(\d+)')
+
+
+class ViewCounter:
+    """
+    Write-behind destination view counter.
+
+    A view is one HINCRBY on a Redis hash instead of an UPDATE on the
+    destination row, so popular destinations do not serialize on a row
+    lock. `tasks.destination.flush_view_counts` periodically moves the
+    buffered counts into destinations.view_count in one batched UPDATE and
+    records the new totals back in Redis.
+
+    Redis failures are logged and the view is not counted; after a failure
+    redis is skipped for `cache_redis_retry_after` seconds.
+    """
+
+    def __init__(self):
+        self._redis_down_until = 0.0
+
+    async def record(
+        self,
+        slug: str,
+        payload: Optional[bytes] = None,
+        load_total: Optional[Callable[[], Awaitable[Optional[int]]]] = None,
+    ) -> Optional[bytes]:
+        """
+        Count a view of `slug` and return the details payload with its
+        view_count replaced by the live count (stored total + buffered views).
+
+        The document's own view_count is never refreshed by the flush, so a
+        missing total (never flushed, evicted, or Redis restarted) is read
+        through `load_total` (destinations.view_count) and seeded back.
+        """
+        if time.monotonic() < self._redis_down_until:
+            return payload
+
+        try:
+            redis = get_redis()
+            # MULTI: the three hashes are read at one point between flushes
+            pipe = redis.pipeline(transaction=True)
+            pipe.hincrby(PENDING_KEY, slug, 1)
+            pipe.hget(FLUSHING_KEY, slug)
+            pipe.hget(TOTALS_KEY, slug)
+            pending, flushing, total = await pipe.execute()
+        except (RedisError, OSError) as e:
+            self._redis_down_until = time.monotonic() + settings.cache_redis_retry_after
+            logger.warning(f"View counter: redis failed: {e}")
+            return payload
+
+        if payload is None:
+            return None
+
+        match = VIEW_COUNT_PATTERN.search(payload)
+        if match is None:
+            return payload
+
+        if total is None and load_total is not None:
+            total = await load_total()
+            if total is not None:
+                try:
+                    # NX: a flush that finished meanwhile wrote a newer total
+                    await redis.hsetnx(TOTALS_KEY, slug, total)
+                except (RedisError, OSError) as e:
+                    logger.warning(f"View counter: redis seed failed: {e}")
+
+        stored = int(total) if total is not None else int(match.group(2))
+        count = stored + int(flushing or 0) + pending
+
+        return b"".join((
+            payload[:match.start(2)],
+            str(count).encode(),
+            payload[match.end(2):],
+        ))
+
+    async def forget(self, slug: str) -> None:
+        """Drop a deleted destination's counts, its slug may be reused"""
+        try:
+            pipe = get_redis().pipeline(transaction=True)
+            for key in (PENDING_KEY, FLUSHING_KEY, TOTALS_KEY):
+                pipe.hdel(key, slug)
+            await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning(f"View counter: redis forget failed: {e}")
+
+
+view_counter = ViewCounter()
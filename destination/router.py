@@ -2,7 +2,8 @@ from uuid import UUID
 
 from typing import List, Optional
 from app.utils.print_log import print_log
-from fastapi import APIRouter, HTTPException, UploadFile, Depends, File, Form, Body, Query
+from fastapi import APIRouter, HTTPException, UploadFile, Depends, File, Form, Body, Query, Header, Request, Response
+from fastapi.responses import StreamingResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,23 +12,34 @@ from app.base.schema import (
     DataResponse,
     ListResponse
 )
+from app.base.responses import raw_data_response, not_modified_response
+from app.utils.etag import etag_matches
+from app.db.counting import CountStrategy
+from app.utils.ndjson import iter_lines
 from destination.services import (
     DestinationService, 
     TransportTypeService, 
     AccommodationTypeService,
     ActivityTypeService,
+    NearbyService,
 )
 
 from destination.schema import (
     DestinationCreateRequest,
+    DestinationUpdateRequest,
     AccommodationTypeRequest,
     TransportTypeRequest,
     ActivityTypeRequest,
 )
+from destination.schemas import DestinationListFilters, DestinationListSort, DestinationExportFormat
+from destination.db.models import CostLevel
  
-from app.db.session import get_async_session
+from app.core.config import get_settings
+from app.db.session import get_async_session, AsyncSessionLocal
 from auth.helpers.dependencies import get_current_user
 
+settings = get_settings()
+
 router = APIRouter()
 
 # destination routes
@@ -39,16 +51,49 @@ async def get_destination_service(
 
 @router.get("/list", response_model=ListResponse)
 async def list_destinations(
-    page: int = Query(1, ge=1),
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1, description="Offset page; ignored when cursor is given"),
     page_size: int = Query(10, ge=1, le=100),
     search_query: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from meta.next_cursor, takes precedence over page"),
+    fields: Optional[str] = Query(None, description="Comma separated fields to return, e.g. slug,name,images"),
+    count: Optional[CountStrategy] = Query(None, description="How meta.total is computed: exact, estimated or none"),
+    country: List[str] = Query([]),
+    region: List[str] = Query([]),
+    cost_level: List[CostLevel] = Query([]),
+    tags: List[str] = Query([], description="Destinations having all of these tags"),
+    suitable_for: List[str] = Query([], description="Destinations suitable for all of these"),
+    popular_for: List[str] = Query([], description="Destinations popular for all of these"),
+    facets: bool = Query(False, description="Include per-value facet counts in meta.facets"),
+    sort: Optional[DestinationListSort] = Query(None, description="trending: by popularity; default newest first, or relevance when searching"),
+    if_none_match: Optional[str] = Header(None),
     service: DestinationService = Depends(get_destination_service),
     # user_id: UUID = Depends(get_current_user)
 ):
-    destination_list, total_count = await service.destination_list(
+    etag = await service.destination_list_etag(request.url.query)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+
+    filters = DestinationListFilters(
+        country=country,
+        region=region,
+        cost_level=cost_level,
+        tags=tags,
+        suitable_for=suitable_for,
+        popular_for=popular_for,
+    )
+    destination_list, total_count, next_cursor, facet_counts = await service.destination_list(
         page,
         page_size,
         search_query,
+        cursor,
+        fields,
+        count,
+        filters,
+        facets,
+        sort,
     )
     return ListResponse(
         success=True,
@@ -56,19 +101,163 @@ async def list_destinations(
         page=page,
         page_size=page_size,
         total=total_count,
+        next_cursor=next_cursor,
+        facets=facet_counts,
         message="Destination list fetched successfully.",
     )
 
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def _export_chunks(
+    export_format: DestinationExportFormat,
+    filters: DestinationListFilters,
+    include_details: bool,
+):
+    # the body streams after the request's dependencies are done with,
+    # so the cursor gets a session of its own
+    async with AsyncSessionLocal() as db:
+        async for chunk in DestinationService(db).export_destinations(export_format, filters, include_details):
+            yield chunk
+
+
+@router.get("/export")
+async def export_destinations(
+    format: DestinationExportFormat = Query("ndjson"),
+    include_details: bool = Query(False, description="Add the full destination details to every row"),
+    country: List[str] = Query([]),
+    region: List[str] = Query([]),
+    cost_level: List[CostLevel] = Query([]),
+    tags: List[str] = Query([], description="Destinations having all of these tags"),
+    suitable_for: List[str] = Query([], description="Destinations suitable for all of these"),
+    popular_for: List[str] = Query([], description="Destinations popular for all of these"),
+    # user_id: UUID = Depends(get_current_user)
+):
+    """
+    Stream the destination catalog, oldest first, as NDJSON (one
+    destination per line) or CSV. Rows are read through a server-side
+    cursor, so memory stays flat whatever the catalog size.
+    """
+    filters = DestinationListFilters(
+        country=country,
+        region=region,
+        cost_level=cost_level,
+        tags=tags,
+        suitable_for=suitable_for,
+        popular_for=popular_for,
+    )
+    return StreamingResponse(
+        _export_chunks(format, filters, include_details),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="destinations.{format}"'},
+    )
+
+# nearby routes
+async def get_nearby_service(
+    db: AsyncSession = Depends(get_async_session),
+) -> NearbyService:
+    return NearbyService(db)
+
+
+class NearbyParams:
+    def __init__(
+        self,
+        lat: float = Query(..., ge=-90, le=90),
+        lng: float = Query(..., ge=-180, le=180),
+        radius: float = Query(5000, gt=0, le=settings.geo_max_radius_m, description="Metres"),
+        limit: int = Query(20, ge=1, le=100),
+    ):
+        self.lat = lat
+        self.lng = lng
+        self.radius = radius
+        self.limit = limit
+
+
+@router.get("/nearby", response_model=ListResponse)
+async def nearby_destinations(
+    params: NearbyParams = Depends(),
+    service: NearbyService = Depends(get_nearby_service),
+):
+    destinations = await service.nearby_destinations(params.lat, params.lng, params.radius, params.limit)
+    return ListResponse(
+        success=True,
+        data=destinations,
+        page=1,
+        page_size=params.limit,
+        message="Nearby destinations fetched successfully.",
+    )
+
+
+@router.get("/attractions/nearby", response_model=ListResponse)
+async def nearby_attractions(
+    params: NearbyParams = Depends(),
+    service: NearbyService = Depends(get_nearby_service),
+):
+    attractions = await service.nearby_attractions(params.lat, params.lng, params.radius, params.limit)
+    return ListResponse(
+        success=True,
+        data=attractions,
+        page=1,
+        page_size=params.limit,
+        message="Nearby attractions fetched successfully.",
+    )
+
+
+@router.get("/accommodations/nearby", response_model=ListResponse)
+async def nearby_accommodations(
+    params: NearbyParams = Depends(),
+    service: NearbyService = Depends(get_nearby_service),
+):
+    accommodations = await service.nearby_accommodations(params.lat, params.lng, params.radius, params.limit)
+    return ListResponse(
+        success=True,
+        data=accommodations,
+        page=1,
+        page_size=params.limit,
+        message="Nearby accommodations fetched successfully.",
+    )
+
+
+@router.get("/attractions/geofence", response_model=ListResponse)
+async def attraction_geofence(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius: float = Query(200, gt=0, le=settings.attraction_geofence_max_radius_m, description="Metres"),
+    limit: int = Query(20, ge=1, le=100),
+    service: NearbyService = Depends(get_nearby_service),
+):
+    attractions = await service.attraction_geofence(lat, lng, radius)
+    return ListResponse(
+        success=True,
+        data=attractions[:limit],
+        page=1,
+        page_size=limit,
+        total=len(attractions),
+        message="Geofence attractions fetched successfully.",
+    )
+
+
 @router.get("", response_model=DataResponse)
 async def get_destination_details(
     destination_slug: str = Query(),
+    if_none_match: Optional[str] = Header(None),
     service: DestinationService = Depends(get_destination_service),
     # user_id: UUID = Depends(get_current_user)
 ):
-    destination_details = await service.destination_details(destination_slug)
-    return DataResponse(    
+    etag, destination_details = await service.destination_details(
+        destination_slug,
+        if_none_match,
+    )
+    if destination_details is None or etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    return raw_data_response(
         data=destination_details,
         message="Destination details fetched successfully!",
+        headers={"ETag": etag},
     )
 
 
@@ -87,6 +276,25 @@ async def create_new_destination(
     )
 
 
+@router.post("/import", response_model=DataResponse)
+async def import_destinations(
+    request: Request,
+    service: DestinationService = Depends(get_destination_service),
+    # user_id: UUID = Depends(get_current_user)
+):
+    """
+    Bulk create destinations from an NDJSON body (application/x-ndjson),
+    one DestinationCreateRequest per line. The body is read as it streams.
+    """
+    summary = await service.import_destinations(iter_lines(request.stream()))
+
+    return DataResponse(
+        success=True,
+        data=summary,
+        message=f"Imported {summary['created']} destinations, {summary['failed']} failed.",
+    )
+
+
 @router.post("/upload-images", response_model=ListResponse)
 async def upload_images(
     type: List[str] = Form(...),
@@ -150,6 +358,25 @@ async def upload_images(
 
 
 
+@router.patch("/{destination_id}", response_model=DataResponse)
+async def update_destination(
+    destination_id: UUID,
+    destination_payload: DestinationUpdateRequest = Body(...),
+    service: DestinationService = Depends(get_destination_service),
+    # user_id: UUID = Depends(get_current_user)
+):
+    destination_details = await service.update_destination(
+        destination_id,
+        destination_payload.model_dump(exclude_unset=True),
+    )
+
+    return DataResponse(
+        success=True,
+        data=destination_details,
+        message="Destination updated successfully!",
+    )
+
+
 @router.delete("/{destination_id}", response_model=BaseResponse)
 async def delete_destination(
     destination_id: UUID,
@@ -184,8 +411,15 @@ async def create_accommodation_type(
 
 @router.get("/accommodation-type/list", response_model=DataResponse)
 async def list_accommodation_types(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: AccommodationTypeService = Depends(get_accommodation_type_service),
 ):
+    etag = await service.accommodation_type_list_etag()
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+
     accommodation_type_list = await service.accommodation_type_list()
 
     return DataResponse(
@@ -216,8 +450,15 @@ async def create_transport_type(
 
 @router.get("/transport-type/list", response_model=DataResponse)
 async def list_transport_types(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: TransportTypeService = Depends(get_transport_type_service),
 ):
+    etag = await service.transport_type_list_etag()
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+
     transport_type_list = await service.transport_type_list()
 
     return DataResponse(
@@ -248,8 +489,15 @@ async def create_activity_type(
 
 @router.get("/activity-type/list", response_model=DataResponse)
 async def list_activity_types(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: ActivityTypeService = Depends(get_activity_type_service),
 ):
+    etag = await service.activity_type_list_etag()
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+
     activity_type_list = await service.activity_type_list()
 
     return DataResponse(
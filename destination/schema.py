@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from fastapi import UploadFile
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional, Any
+from typing import List, Optional
 
 
 class AccommodationTypeRequest(BaseModel):
@@ -150,6 +150,66 @@ class DestinationCreateRequest(BaseModel):
     attractions: List[AttractionRequest]
 
 
+# PATCH items: with an id they replace that existing child, without one
+# they are inserted. Children missing from a sent collection are deleted.
+class DestinationAccommodationTypeUpdate(DestinationAccommodationTypeRequest):
+    id: Optional[UUID] = None
+
+class TransportOptionUpdate(TransportOptionRequest):
+    id: Optional[UUID] = None
+
+class ActivityUpdate(ActivityRequest):
+    id: Optional[UUID] = None
+
+class SignatureDishUpdate(SignatureDishRequest):
+    id: Optional[UUID] = None
+
+class AccommodationUpdate(AccommodationRequest):
+    id: Optional[UUID] = None
+
+class AttractionUpdate(AttractionRequest):
+    id: Optional[UUID] = None
+
+
+class DestinationUpdateRequest(BaseModel):
+    """destination partial update schema, only the fields sent are changed"""
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+    best_time: Optional[str] = None
+    cost_level: Optional[str] = None
+    avg_duration: Optional[str] = None
+
+    suitable_for: Optional[List[str]] = None
+    popular_for: Optional[List[str]] = None
+
+    country: Optional[str] = None
+    region: Optional[str] = None
+    longitude: Optional[str] = None
+    latitude: Optional[str] = None
+    timezone: Optional[str] = None
+
+    weather: Optional[str] = None
+    peak_season: Optional[str] = None
+    festivals: Optional[str] = None
+
+    languages: Optional[List[str]] = None
+    payment_methods: Optional[List[str]] = None
+
+    safety_tips: Optional[str] = None
+    customs: Optional[str] = None
+    how_to_reach: Optional[str] = None
+
+    accommodation_types: Optional[List[DestinationAccommodationTypeUpdate]] = None
+    accommodations: Optional[List[AccommodationUpdate]] = None
+    transport_options: Optional[List[TransportOptionUpdate]] = None
+    activities: Optional[List[ActivityUpdate]] = None
+    signature_dishes: Optional[List[SignatureDishUpdate]] = None
+    attractions: Optional[List[AttractionUpdate]] = None
+
+
 class AttractionDetails(BaseModel):
     """Attraction response"""
     model_config = ConfigDict(from_attributes=True)
@@ -1,2 +1,10 @@
 from .details import DestinationBasicDetails, DestinationDetails, DestinationFullDetails
-from .response import DestinationDetailsResponse
\ No newline at end of file
+from .response import (
+    DestinationDetailsResponse,
+    NearbyDestination,
+    NearbyAttraction,
+    NearbyAccommodation,
+    GeofenceAttraction,
+    DestinationExportRow,
+)
+from .request import DestinationListFilters, DestinationListSort, DestinationExportFormat
\ No newline at end of file
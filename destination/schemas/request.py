@@ -0,0 +1,28 @@
+from typing import Literal, Tuple
+from pydantic import BaseModel, ConfigDict
+
+from destination.db.models import CostLevel
+
+# list orders besides the default (newest first, or relevance when searching)
+DestinationListSort = Literal["trending"]
+
+# catalog export encodings
+DestinationExportFormat = Literal["ndjson", "csv"]
+
+
+class DestinationListFilters(BaseModel):
+    """
+    Faceted filters for the destination list.
+
+    Values within country, region and cost_level are OR'ed; tags,
+    suitable_for and popular_for must all be present on the destination.
+    Frozen so a filter set can be part of a cache key.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    country: Tuple[str, ...] = ()
+    region: Tuple[str, ...] = ()
+    cost_level: Tuple[CostLevel, ...] = ()
+    tags: Tuple[str, ...] = ()
+    suitable_for: Tuple[str, ...] = ()
+    popular_for: Tuple[str, ...] = ()
@@ -64,3 +64,96 @@ class DestinationDetailsResponse(BaseModel):
     
     created_at: datetime
     updated_at: datetime
+
+
+class NearbyDestination(BaseModel):
+    """Destination near a point, closest first"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    slug: str
+    name: str
+    country: str
+    region: str
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    distance_m: float
+
+
+class NearbyAttraction(BaseModel):
+    """Attraction near a point, closest first"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    destination_id: UUID
+    name: str
+    tag: Optional[str] = None
+    region: Optional[str] = None
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    distance_m: float
+
+
+class NearbyAccommodation(BaseModel):
+    """Accommodation near a point, closest first"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    destination_id: UUID
+    name: str
+    price_range: str
+    rating: Optional[Decimal] = None
+    region: Optional[str] = None
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    distance_m: float
+
+
+class GeofenceAttraction(BaseModel):
+    """Attraction whose geofence contains a point, closest first"""
+    id: UUID
+    destination_id: UUID
+    name: str
+    distance_m: float
+
+
+class DestinationExportRow(BaseModel):
+    """One destination in a catalog export, without its collections"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    slug: str
+    name: str
+    description: Optional[str]
+    tags: List[str] = []
+
+    best_time: Optional[str]
+    cost_level: Optional[str]
+    avg_duration: Optional[str]
+
+    suitable_for: List[str] = []
+    popular_for: List[str] = []
+
+    country: str
+    region: str
+    longitude: Optional[Decimal]
+    latitude: Optional[Decimal]
+    timezone: Optional[str]
+
+    weather: Optional[str]
+    peak_season: Optional[str]
+    festivals: Optional[str]
+
+    languages: List[str] = []
+    payment_methods: List[str] = []
+
+    safety_tips: Optional[str]
+    customs: Optional[str]
+    how_to_reach: Optional[str]
+
+    is_active: bool
+    is_featured: bool
+    view_count: int
+
+    created_at: datetime
+    updated_at: datetime
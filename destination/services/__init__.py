@@ -1,4 +1,5 @@
 from .destination import DestinationService
 from .accommodation import AccommodationTypeService
 from .transport import TransportTypeService
-from .activity import ActivityTypeService
\ No newline at end of file
+from .activity import ActivityTypeService
+from .nearby import NearbyService
\ No newline at end of file
@@ -1,4 +1,5 @@
 from destination.db.crud import AccommodationCRUD
+from destination.helpers.reference_registry import reference_registry
 
 class AccommodationTypeService:
   def __init__(self, db):
@@ -6,10 +7,17 @@ class AccommodationTypeService:
     self.accommodation_crud = AccommodationCRUD(db)
   
 
-  def create_accommodation_type(self, accommodation_data: dict):
-    return self.accommodation_crud.create_accommodation_type(
+  async def create_accommodation_type(self, accommodation_data: dict):
+    accommodation_type = await self.accommodation_crud.create_accommodation_type(
       accommodation_data
     )
+    await reference_registry.load(self.db)
+    return accommodation_type
   
-  def accommodation_type_list(self):
-    return self.accommodation_crud.accommodation_type_list()
\ No newline at end of file
+  async def accommodation_type_list(self):
+    snapshot = await reference_registry.get(self.db)
+    return list(snapshot.accommodation_types)
+
+  async def accommodation_type_list_etag(self):
+    snapshot = await reference_registry.get(self.db)
+    return snapshot.etag("accommodation_types")
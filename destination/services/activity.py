@@ -1,14 +1,22 @@
 from destination.db.crud import ActivityCRUD
+from destination.helpers.reference_registry import reference_registry
 
 class ActivityTypeService:
   def __init__(self, db):
     self.db = db
     self.activity_crud = ActivityCRUD(db)
 
-  def create_activity_type(self, activity_data: dict):
-    return self.activity_crud.create_activity_type(
+  async def create_activity_type(self, activity_data: dict):
+    activity_type = await self.activity_crud.create_activity_type(
       activity_data
     )
+    await reference_registry.load(self.db)
+    return activity_type
   
-  def activity_type_list(self):
-    return self.activity_crud.activity_type_list()
\ No newline at end of file
+  async def activity_type_list(self):
+    snapshot = await reference_registry.get(self.db)
+    return list(snapshot.activity_types)
+
+  async def activity_type_list_etag(self):
+    snapshot = await reference_registry.get(self.db)
+    return snapshot.etag("activity_types")
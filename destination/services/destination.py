@@ -1,18 +1,51 @@
+import io
+import csv
 import asyncio
 from uuid import UUID
-from typing import Optional
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
 from app.utils.print_log import print_log
 
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.exceptions import APIError, BadRequestError, RecordNotFoundError, ValidationError
+from app.db.counting import CountStrategy
 from app.utils.cloudinary_manager import CloudinaryImageManager
+from app.utils.etag import make_etag, weak_etag, etag_matches
 
 from destination.db.crud import (
 	DestinationCRUD, 
 	AccommodationCRUD, 
 	TransportCRUD, 
-	ActivityCRUD
+	ActivityCRUD,
+	CatalogVersionCRUD,
+	DESTINATION_LIST_FIELDS,
 )
+from destination.db.models import DESTINATIONS_VERSION, ATTRACTIONS_VERSION
 
-from destination.schema import DestinationImageDetails
+from destination.schema import DestinationImageDetails, DestinationCreateRequest
+from destination.schemas import (
+	DestinationListFilters,
+	DestinationListSort,
+	DestinationExportFormat,
+	DestinationExportRow,
+)
+from destination.helpers.cache import (
+	destination_details_cache,
+	destination_missing_slugs,
+	MISSING,
+	pack_details,
+	unpack_details,
+)
+from destination.helpers.reference_registry import reference_registry
+from destination.helpers.geo_index import attraction_geo_index
+from destination.helpers.view_counter import view_counter
+from destination.tasks import purge_images
+
+settings = get_settings()
+logger = setup_logging()
 
 class DestinationService:
 	def __init__(self, db):
@@ -21,33 +54,50 @@ class DestinationService:
 		self.accommodation_crud = AccommodationCRUD(db)
 		self.transport_crud = TransportCRUD(db)
 		self.activity_crud = ActivityCRUD(db)
+		self.catalog_version_crud = CatalogVersionCRUD(db)
 		self.image_manager = CloudinaryImageManager()
 
 	async def __validate_reference_ids(self, destination_data: dict):
 		"""
-		Validate that all referenced accommodation, transport, and activity types exist
+		Validate that all referenced accommodation, transport, and activity
+		types exist, in memory against the reference registry. Every bad id
+		is reported at once.
 		"""
-		# Validate accommodation types
-		for acc_type in destination_data.get("accommodation_types", []):
-			type_id = UUID(acc_type["accommodation_type_id"])
-		
-			exists = await self.accommodation_crud.get_accommodation_type_by_id(type_id)
-			if not exists:
-				raise ValueError(f"Accommodation type with ID {type_id} does not exist")
+		references = await reference_registry.get(self.db)
+		errors = self.__reference_errors(destination_data, references)
 
-		# Validate transport types
-		for transport in destination_data.get("transport_options", []):
-			type_id = UUID(transport["transport_type_id"])
-			exists = await self.transport_crud.get_transport_type_by_id(type_id)
-			if not exists:
-				raise ValueError(f"Transport type with ID {type_id} does not exist")
+		if errors:
+			# the snapshot may predate a type another process just created
+			fresh = await reference_registry.get(self.db, refresh=True)
+			if fresh is not references:
+				errors = self.__reference_errors(destination_data, fresh)
+
+		if errors:
+			raise ValidationError("Invalid reference ids", details={"errors": errors})
+
+
+	def __reference_errors(self, destination_data: dict, references) -> List[str]:
+		"""
+		Every missing or malformed reference id in the payload, checked
+		against a ReferenceSnapshot
+		"""
+		errors = []
+		for key, id_key, known_ids, label in (
+			("accommodation_types", "accommodation_type_id", references.accommodation_type_ids, "Accommodation type"),
+			("transport_options", "transport_type_id", references.transport_type_ids, "Transport type"),
+			("activities", "activity_type_id", references.activity_type_ids, "Activity type"),
+		):
+			for item in destination_data.get(key) or []:
+				try:
+					type_id = UUID(item[id_key])
+				except ValueError:
+					errors.append(f"{label} ID {item[id_key]} is not a valid UUID")
+					continue
 
-		# Validate activity types
-		for activity in destination_data.get("activities", []):
-			type_id = UUID(activity["activity_type_id"])
-			exists = await self.activity_crud.get_activity_type_by_id(type_id)
-			if not exists:
-				raise ValueError(f"Activity type with ID {type_id} does not exist")
+				if type_id not in known_ids:
+					errors.append(f"{label} with ID {type_id} does not exist")
+
+		return errors
 
 
 	async def __image_uploader(self, images: list[dict]) -> list[dict]:
@@ -139,42 +189,313 @@ class DestinationService:
 
 			created_destination = await self.destination_crud.create(destination_data)
 
+			if created_destination.attractions:
+				attraction_geo_index.add(
+					(attraction.id, created_destination.id, attraction.name, attraction.latitude, attraction.longitude)
+					for attraction in created_destination.attractions
+				)
+				attraction_geo_index.applied(await self.catalog_version_crud.get(ATTRACTIONS_VERSION))
+
 			# 2. bring vector resources and handle vector database
 
 			return created_destination
 			
         
+		except APIError:
+			raise
 		except Exception as e:
 			raise Exception(f"Failed to create destination: {str(e)}")
 	
 	
+	async def import_destinations(
+		self,
+		lines: AsyncIterable[bytes],
+		chunk_size: Optional[int] = None,
+	) -> dict:
+		"""
+		Bulk create destinations from NDJSON, one DestinationCreateRequest
+		per line.
+
+		Records are validated as they stream in and inserted in chunks of
+		`destination_import_chunk_size`, each chunk in its own transaction
+		with one multi-row INSERT per table. A chunk that fails is retried
+		record by record, so one bad record does not sink its neighbours.
+
+		Returns the created/failed counts and a result per non-empty line.
+		"""
+		chunk_size = chunk_size or settings.destination_import_chunk_size
+		references = await reference_registry.get(self.db)
+
+		results = []
+		chunk = []  # (line number, record)
+		line_number = 0
+
+		async for line in lines:
+			line_number += 1
+			if not line.strip():
+				continue
+
+			try:
+				record = DestinationCreateRequest.model_validate_json(line).model_dump()
+			except PydanticValidationError as e:
+				results.append(self.__import_failure(line_number, [
+					f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+					for error in e.errors(include_url=False)
+				]))
+				continue
+
+			errors = self.__reference_errors(record, references)
+			if errors:
+				results.append(self.__import_failure(line_number, errors))
+				continue
+
+			chunk.append((line_number, record))
+			if len(chunk) >= chunk_size:
+				results += await self.__import_chunk(chunk)
+				chunk = []
+
+		if chunk:
+			results += await self.__import_chunk(chunk)
+
+		results.sort(key=lambda result: result["line"])
+		created = sum(1 for result in results if result["status"] == "created")
+		return {"created": created, "failed": len(results) - created, "results": results}
+
+	async def __import_chunk(self, chunk: List[Tuple[int, dict]]) -> List[dict]:
+		try:
+			created = await self.destination_crud.bulk_create([record for _, record in chunk])
+			await self.db.commit()
+		except Exception as e:
+			await self.db.rollback()
+			if len(chunk) == 1:
+				return [self.__import_failure(chunk[0][0], [str(getattr(e, "orig", e))])]
+
+			results = []
+			for item in chunk:
+				results += await self.__import_chunk([item])
+			return results
+
+		await self.catalog_version_crud.bump_committed(DESTINATIONS_VERSION)
+		await destination_missing_slugs.delete(*[slug for _, slug, _ in created])
+
+		attractions = [
+			(row["id"], destination_id, row["name"], row["latitude"], row["longitude"])
+			for destination_id, _, rows in created
+			for row in rows
+		]
+		if attractions:
+			attraction_geo_index.add(attractions)
+			attraction_geo_index.applied(await self.catalog_version_crud.get(ATTRACTIONS_VERSION))
+
+		return [
+			{"line": line_number, "status": "created", "id": str(destination_id), "slug": slug}
+			for (line_number, _), (destination_id, slug, _) in zip(chunk, created)
+		]
+
+	@staticmethod
+	def __import_failure(line_number: int, errors: List[str]) -> dict:
+		return {"line": line_number, "status": "failed", "errors": errors}
+
+
+	async def update_destination(self, destination_id: UUID, changes: dict):
+		"""
+		Partially update a destination and its child collections, see
+		DestinationCRUD.update
+		"""
+		try:
+			await self.__validate_reference_ids(changes)
+
+			removed, written = await self.destination_crud.update(destination_id, changes)
+
+			if removed or written:
+				# rows whose coordinates were cleared must leave the index too
+				attraction_geo_index.remove([*removed, *(row["id"] for row in written)])
+				attraction_geo_index.add(
+					(row["id"], destination_id, row["name"], row["latitude"], row["longitude"])
+					for row in written
+				)
+				attraction_geo_index.applied(await self.catalog_version_crud.get(ATTRACTIONS_VERSION))
+
+			return await self.destination_crud.get_details_response(destination_id)
+
+		except APIError:
+			await self.db.rollback()
+			raise
+		except Exception as e:
+			await self.db.rollback()
+			raise Exception(f"Failed to update destination: {str(e)}")
+
+
 	async def delete_destination(self, destination_id: UUID):
 		"""
 		Delete destination with destination_id
 		** Later clear the vector db resources
 		"""
 		try:
-			await self.destination_crud.delete(destination_id)
-		
+			public_ids = await self.destination_crud.delete(destination_id)
+
+			attraction_geo_index.remove_destination(destination_id)
+			attraction_geo_index.applied(await self.catalog_version_crud.get(ATTRACTIONS_VERSION))
+
+		except APIError:
+			raise
 		except Exception as e:
 			raise Exception(f"Failed to delete destination: {str(e)}")
 
+		if public_ids:
+			# the delete is committed; a broker outage must not fail it
+			try:
+				purge_images.delay(public_ids)
+			except Exception as e:
+				logger.error(f"Could not queue Cloudinary purge of {public_ids}: {e}")
+
+
+	def __parse_list_fields(self, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+		"""
+		Comma separated sparse fieldset -> ordered, de-duplicated field names
+		"""
+		if not fields:
+			return None
+
+		requested = tuple(dict.fromkeys(
+			name.strip() for name in fields.split(",") if name.strip()
+		))
+		unknown = [name for name in requested if name not in DESTINATION_LIST_FIELDS]
+		if unknown:
+			raise BadRequestError(
+				f"Unknown fields: {', '.join(unknown)}",
+				details={"allowed_fields": list(DESTINATION_LIST_FIELDS)},
+			)
+
+		return requested or None
 
 	async def destination_list(
 		self, 
 		page: int, 
 		page_size: int = 10, 
-		search_query: Optional[str] = None
+		search_query: Optional[str] = None,
+		cursor: Optional[str] = None,
+		fields: Optional[str] = None,
+		count: Optional[CountStrategy] = None,
+		filters: Optional[DestinationListFilters] = None,
+		facets: bool = False,
+		sort: Optional[DestinationListSort] = None,
 	):
-		
-		destination_list, total_count = await self.destination_crud.get_list(
+		"""
+		A page of destinations. With `facets` the per-value facet counts are
+		computed in the same statement as the page.
+		"""
+		return await self.destination_crud.get_list(
 			page, 
 			page_size, 
-			search_query
+			search_query,
+			cursor,
+			self.__parse_list_fields(fields),
+			count,
+			filters,
+			sort,
+			facets,
 		)
-
-		return destination_list, total_count
 	
 
-	async def destination_details(self, slug: str):
-		return await self.destination_crud.get_by_slug(slug)
\ No newline at end of file
+	async def export_destinations(
+		self,
+		export_format: DestinationExportFormat = "ndjson",
+		filters: Optional[DestinationListFilters] = None,
+		include_details: bool = False,
+	) -> AsyncIterator[bytes]:
+		"""
+		The catalog as NDJSON lines or CSV rows, one chunk per cursor batch,
+		so memory stays flat whatever the catalog size.
+
+		With `include_details` every NDJSON line carries the full
+		DestinationFullDetails under "details", CSV gets it as a JSON text
+		column. CSV list values are joined with "|".
+		"""
+		columns = list(DestinationExportRow.model_fields)
+		buffer = io.StringIO()
+		writer = csv.writer(buffer)
+
+		if export_format == "csv":
+			writer.writerow(columns + ["details"] if include_details else columns)
+			yield buffer.getvalue().encode()
+
+		async for batch in self.destination_crud.stream_export(filters, include_details):
+			if export_format == "csv":
+				buffer.seek(0)
+				buffer.truncate()
+				for row, details in batch:
+					values = DestinationExportRow.model_validate(row).model_dump(mode="json")
+					writer.writerow(
+						[self.__csv_value(values[name]) for name in columns]
+						+ ([details] if include_details else [])
+					)
+				yield buffer.getvalue().encode()
+				continue
+
+			lines = []
+			for row, details in batch:
+				line = DestinationExportRow.model_validate(row).model_dump_json()
+				if details is not None:
+					# the document is JSON text already, spliced in as is
+					line = f'{line[:-1]},"details":{details}}}'
+				lines.append(line + "\n")
+			yield "".join(lines).encode()
+
+	@staticmethod
+	def __csv_value(value):
+		if isinstance(value, list):
+			return "|".join(value)
+		return "" if value is None else value
+
+	async def destination_details(
+		self,
+		slug: str,
+		if_none_match: Optional[str] = None,
+	) -> Tuple[str, Optional[bytes]]:
+		"""
+		Etag and serialized DestinationFullDetails for the slug, read through
+		the details cache and then the materialized destination document.
+
+		The payload is None when if_none_match already matches the current
+		etag, so a 304 never reads the document itself. Every call counts a
+		view; view_count in the payload is the live count, so the etag is
+		weak: it covers the document version, not the exact bytes.
+
+		Unknown slugs raise RecordNotFoundError (404) and are remembered for
+		`destination_missing_slug_ttl` seconds without touching Postgres.
+		"""
+		entry = await destination_details_cache.get(slug)
+		if entry is not None:
+			etag, payload = unpack_details(entry)
+			return weak_etag(etag), await view_counter.record(slug, payload, partial(self.destination_crud.get_view_count, slug))
+
+		if await destination_missing_slugs.get(slug) is not None:
+			raise RecordNotFoundError("Destination", slug)
+
+		if if_none_match:
+			etag = await self.destination_crud.get_document_etag(slug)
+			if etag and etag_matches(if_none_match, etag):
+				await view_counter.record(slug)
+				return weak_etag(etag), None
+
+		document = await self.destination_crud.get_document(slug)
+		if document is None:
+			# not materialized yet (e.g. rows older than the documents table)
+			try:
+				destination_id = await self.destination_crud.get_id_by_slug(slug)
+			except RecordNotFoundError:
+				await destination_missing_slugs.set(slug, MISSING)
+				raise
+			documents = await self.destination_crud.rebuild_documents([destination_id])
+			await self.db.commit()
+			document = documents[slug]
+
+		etag, payload = document
+		await destination_details_cache.set(slug, pack_details(etag, payload))
+		return weak_etag(etag), await view_counter.record(slug, payload, partial(self.destination_crud.get_view_count, slug))
+
+	async def destination_list_etag(self, *params) -> str:
+		"""List-level etag: moves with every destination write"""
+		version = await self.catalog_version_crud.get(DESTINATIONS_VERSION)
+		return make_etag(DESTINATIONS_VERSION, version, *params)
@@ -0,0 +1,78 @@
+from destination.db.crud import GeoCRUD
+from destination.helpers.geo_index import attraction_geo_index
+from destination.db.models import Destination, Attraction, Accommodation
+from destination.schemas import (
+  NearbyDestination,
+  NearbyAttraction,
+  NearbyAccommodation,
+  GeofenceAttraction,
+)
+
+class NearbyService:
+  def __init__(self, db):
+    self.db = db
+    self.geo_crud = GeoCRUD(db)
+
+  async def nearby_destinations(self, latitude: float, longitude: float, radius_m: float, limit: int):
+    rows = await self.geo_crud.nearby(
+      Destination,
+      (
+        Destination.id,
+        Destination.slug,
+        Destination.name,
+        Destination.country,
+        Destination.region,
+        Destination.latitude,
+        Destination.longitude,
+      ),
+      latitude,
+      longitude,
+      radius_m,
+      limit,
+    )
+    return [NearbyDestination.model_validate(row) for row in rows]
+
+  async def nearby_attractions(self, latitude: float, longitude: float, radius_m: float, limit: int):
+    rows = await self.geo_crud.nearby(
+      Attraction,
+      (
+        Attraction.id,
+        Attraction.destination_id,
+        Attraction.name,
+        Attraction.tag,
+        Attraction.region,
+        Attraction.latitude,
+        Attraction.longitude,
+      ),
+      latitude,
+      longitude,
+      radius_m,
+      limit,
+    )
+    return [NearbyAttraction.model_validate(row) for row in rows]
+
+  async def nearby_accommodations(self, latitude: float, longitude: float, radius_m: float, limit: int):
+    rows = await self.geo_crud.nearby(
+      Accommodation,
+      (
+        Accommodation.id,
+        Accommodation.destination_id,
+        Accommodation.name,
+        Accommodation.price_range,
+        Accommodation.rating,
+        Accommodation.region,
+        Accommodation.latitude,
+        Accommodation.longitude,
+      ),
+      latitude,
+      longitude,
+      radius_m,
+      limit,
+    )
+    return [NearbyAccommodation.model_validate(row) for row in rows]
+
+  async def attraction_geofence(self, latitude: float, longitude: float, radius_m: float):
+    """Served from the in-memory index, the database is only asked for its version"""
+    await attraction_geo_index.sync(self.db)
+    hits = attraction_geo_index.within(latitude, longitude, radius_m)
+    return [GeofenceAttraction(**hit) for hit in hits]
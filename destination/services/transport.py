@@ -1,14 +1,22 @@
 from destination.db.crud import TransportCRUD
+from destination.helpers.reference_registry import reference_registry
 
 class TransportTypeService:
   def __init__(self, db):
     self.db = db
     self.transport_crud = TransportCRUD(db)
 
-  def create_transport_type(self, transport_data: dict):
-    return self.transport_crud.create_transport_type(
+  async def create_transport_type(self, transport_data: dict):
+    transport_type = await self.transport_crud.create_transport_type(
       transport_data
     )
+    await reference_registry.load(self.db)
+    return transport_type
   
-  def transport_type_list(self):
-    return self.transport_crud.transport_type_list()
\ No newline at end of file
+  async def transport_type_list(self):
+    snapshot = await reference_registry.get(self.db)
+    return list(snapshot.transport_types)
+
+  async def transport_type_list_etag(self):
+    snapshot = await reference_registry.get(self.db)
+    return snapshot.etag("transport_types")
@@ -0,0 +1,205 @@
+from typing import Dict, List, Tuple
+
+from redis.exceptions import ResponseError
+from sqlalchemy import select, update, values, column, func, case, cast, Float, String, Integer
+
+from app.core.celery import celery_app
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.redis import get_sync_redis
+from app.db.session import get_sync_session
+from app.utils.cloudinary_manager import CloudinaryImageManager
+
+from destination.db.crud import CatalogVersionCRUD
+from destination.db.models import Destination, Attraction, SignatureDish, DESTINATIONS_VERSION
+from destination.helpers.view_counter import (
+    PENDING_KEY,
+    FLUSHING_KEY,
+    TOTALS_KEY,
+    FLUSH_LOCK_KEY,
+)
+
+settings = get_settings()
+logger = setup_logging()
+
+# Cloudinary's delete_resources accepts at most 100 public_ids per call
+CLOUDINARY_DELETE_BATCH = 100
+
+
+def _add_views(db, views: List[Tuple[str, int]]) -> Dict[str, int]:
+    """
+    view_count += n for every (slug, n), one UPDATE ... FROM (VALUES ...)
+    per batch. Returns the new totals by slug; unknown (deleted) slugs are
+    dropped.
+    """
+    totals = {}
+    # a fixed row order keeps concurrent flushes from deadlocking
+    views = sorted(views)
+
+    for start in range(0, len(views), settings.view_count_flush_batch):
+        pending_views = values(
+            column("slug", String),
+            column("views", Integer),
+            name="pending_views",
+        ).data(views[start:start + settings.view_count_flush_batch])
+
+        stmt = (
+            update(Destination)
+            .where(Destination.slug == pending_views.c.slug)
+            # a view is not an edit: keep updated_at (and the details etag)
+            .values(
+                view_count=func.coalesce(Destination.view_count, 0) + pending_views.c.views,
+                updated_at=Destination.updated_at,
+            )
+            .returning(Destination.slug, Destination.view_count)
+        )
+        totals.update(db.execute(stmt).tuples().all())
+
+    return totals
+
+
+@celery_app.task(name="tasks.destination.flush_view_counts")
+def flush_view_counts() -> int:
+    """
+    Move buffered destination views from Redis into destinations.view_count.
+
+    The pending hash is renamed away first, so views recorded during the
+    flush go to a fresh hash. A batch whose UPDATE failed stays under the
+    flushing key and is retried by the next run.
+    """
+    redis = get_sync_redis()
+    lock = redis.lock(FLUSH_LOCK_KEY, timeout=settings.celery_task_time_limit)
+    if not lock.acquire(blocking=False):
+        return 0
+
+    try:
+        if not redis.exists(FLUSHING_KEY):
+            try:
+                redis.rename(PENDING_KEY, FLUSHING_KEY)
+            except ResponseError:
+                return 0  # no views since the last flush
+
+        views = [
+            (slug.decode(), int(count))
+            for slug, count in redis.hgetall(FLUSHING_KEY).items()
+        ]
+
+        db = get_sync_session()
+        try:
+            totals = _add_views(db, views)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        pipe = redis.pipeline(transaction=True)
+        if totals:
+            pipe.hset(TOTALS_KEY, mapping=totals)
+        pipe.delete(FLUSHING_KEY)
+        pipe.execute()
+
+        logger.info(f"Flushed {sum(count for _, count in views)} views of {len(totals)} destinations")
+        return len(totals)
+    finally:
+        lock.release()
+
+
+def _recommended_count(model):
+    return (
+        select(func.count())
+        .select_from(model)
+        .where(model.destination_id == Destination.id, model.is_recommended.is_(True))
+        .scalar_subquery()
+    )
+
+
+@celery_app.task(name="tasks.destination.rank_destinations")
+def rank_destinations() -> int:
+    """
+    Recompute destinations.trending_score in one UPDATE.
+
+    decayed_views halves every `trending_half_life_hours`: each run decays
+    the stored value for the time since the last run and adds the views
+    flushed since then (view_count - ranked_view_count), so no per-view
+    history is kept. Featured destinations and recommended attractions and
+    dishes add fixed weights on top.
+    """
+    redis = get_sync_redis()
+    # shares the flush lock, both write view derived columns
+    lock = redis.lock(FLUSH_LOCK_KEY, timeout=settings.celery_task_time_limit)
+    if not lock.acquire(blocking=False):
+        return 0
+
+    elapsed_hours = cast(
+        func.extract("epoch", func.now() - func.coalesce(Destination.ranked_at, Destination.created_at)),
+        Float,
+    ) / 3600
+    decayed_views = (
+        Destination.decayed_views * func.power(0.5, elapsed_hours / settings.trending_half_life_hours)
+        + func.greatest(func.coalesce(Destination.view_count, 0) - Destination.ranked_view_count, 0)
+    )
+    trending_score = (
+        decayed_views
+        + case((Destination.is_featured.is_(True), settings.trending_featured_weight), else_=0)
+        + settings.trending_recommended_weight
+        * (_recommended_count(Attraction) + _recommended_count(SignatureDish))
+    )
+
+    stmt = (
+        update(Destination)
+        .values(
+            decayed_views=decayed_views,
+            trending_score=trending_score,
+            ranked_view_count=func.coalesce(Destination.view_count, 0),
+            ranked_at=func.now(),
+            updated_at=Destination.updated_at,
+        )
+    )
+
+    try:
+        db = get_sync_session()
+        try:
+            ranked = db.execute(stmt).rowcount
+            db.commit()
+            # sort=trending pages (and their etags) move with the scores; the
+            # version row is only locked for its own short transaction
+            db.execute(CatalogVersionCRUD.bump_stmt(DESTINATIONS_VERSION))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        logger.info(f"Ranked {ranked} destinations")
+        return ranked
+    finally:
+        lock.release()
+
+
+@celery_app.task(bind=True, name="tasks.destination.purge_images", max_retries=5)
+def purge_images(self, public_ids: List[str]) -> int:
+    """
+    Delete the Cloudinary assets of deleted destinations and attractions,
+    CLOUDINARY_DELETE_BATCH public_ids per API call. A failed batch is
+    retried with backoff together with the ones after it; finished batches
+    are not sent again.
+    """
+    image_manager = CloudinaryImageManager()
+    deleted = 0
+
+    for start in range(0, len(public_ids), CLOUDINARY_DELETE_BATCH):
+        try:
+            result = image_manager.bulk_delete(public_ids[start:start + CLOUDINARY_DELETE_BATCH])
+        except RuntimeError as e:
+            raise self.retry(
+                args=[public_ids[start:]],
+                exc=e,
+                countdown=30 * 2 ** self.request.retries,
+            )
+        deleted += sum(1 for status in result.values() if status == "deleted")
+
+    logger.info(f"Purged {deleted} of {len(public_ids)} images from Cloudinary")
+    return deleted
@@ -0,0 +1,97 @@
+def destination_payload(name: str, reference_ids: dict, size: int = 1) -> dict:
+    """DestinationCreateRequest body with `size` items in every collection"""
+    return {
+        "name": name,
+        "description": "A destination used by the tests",
+        "tags": ["beach", "family"],
+        "best_time": "Winter",
+        "cost_level": "Low",
+        "avg_duration": "2 days",
+        "suitable_for": ["family"],
+        "popular_for": ["beach"],
+        "country": "Bangladesh",
+        "region": "Chattogram",
+        "longitude": "91.9760",
+        "latitude": "21.4272",
+        "timezone": "Asia/Dhaka",
+        "weather": "Tropical",
+        "peak_season": "Winter",
+        "festivals": None,
+        "languages": ["Bangla"],
+        "payment_methods": ["cash"],
+        "safety_tips": None,
+        "customs": None,
+        "how_to_reach": None,
+        "accommodation_types": [
+            {
+                "accommodation_type_id": reference_ids["accommodation"],
+                "price_range": "$$",
+                "availability": "All year",
+                "description": None,
+            }
+        ],
+        "accommodations": [
+            {
+                "name": f"Hotel {i}",
+                "accommodation_type_id": reference_ids["accommodation"],
+                "price_range": "$",
+                "rating": "4.5",
+                "distance": "1 km",
+                "region": "Chattogram",
+                "longitude": "91.9760",
+                "latitude": "21.4272",
+                "phone": None,
+                "email": None,
+                "website": None,
+            }
+            for i in range(size)
+        ],
+        "transport_options": [
+            {
+                "transport_type_id": reference_ids["transport"],
+                "price_range": "$",
+                "availability": "Daily",
+                "description": None,
+            }
+            for _ in range(size)
+        ],
+        "activities": [
+            {
+                "activity_type_id": reference_ids["activity"],
+                "price_range": "$",
+                "duration": "1 hour",
+                "best_season": "Winter",
+                "booking_required": False,
+                "is_popular": True,
+                "description": None,
+            }
+            for _ in range(size)
+        ],
+        "signature_dishes": [
+            {
+                "name": f"Dish {i}",
+                "tags": "fish, spicy",
+                "dietary_info": "halal",
+                "price_range": "$",
+                "is_recommended": True,
+                "local_notes": None,
+            }
+            for i in range(size)
+        ],
+        "attractions": [
+            {
+                "name": f"Attraction {i}",
+                "description": None,
+                "tag": "Nature",
+                "entry_fee": None,
+                "opening_hours": None,
+                "best_time_to_visit": None,
+                "available_transports": ["bus"],
+                "is_recommended": i == 0,
+                "region": "Chattogram",
+                "longitude": f"{91.976 + i / 1000:.4f}",
+                "latitude": "21.4272",
+            }
+            for i in range(size)
+        ],
+    }
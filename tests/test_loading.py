@@ -0,0 +1,122 @@
+"""
+The destination endpoints load exactly what their loader graph declares.
+
+Relationships are lazy="raise" / "raise_on_sql", so an unplanned load raises;
+`raise_loads` also catches one an error handler swallowed. Each path is
+measured on a small and a large destination: the number of statements must
+not grow with the size of the destination's collections.
+"""
+import pytest
+
+from destination.db.crud import DestinationCRUD
+from destination.db.models import Destination
+from destination.schemas import DestinationFullDetails
+
+from tests.factories import destination_payload
+
+pytestmark = pytest.mark.anyio
+
+SMALL, LARGE = 1, 8
+
+
+async def _create(client, name: str, reference_ids: dict, size: int) -> dict:
+    response = await client.post("/create", json=destination_payload(name, reference_ids, size))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+async def test_create(client, statements, raise_loads, reference_ids):
+    # the first write also loads the reference registry
+    await _create(client, "Create Warmup", reference_ids, SMALL)
+
+    counts = []
+    for name, size in (("Create Small", SMALL), ("Create Large", LARGE)):
+        statements.clear()
+        created = await _create(client, name, reference_ids, size)
+        counts.append(len(statements))
+        assert len(created["attractions"]) == size
+
+    assert counts[0] == counts[1]
+    assert raise_loads == []
+
+
+async def test_details(client, statements, raise_loads, reference_ids):
+    await _create(client, "Details Small", reference_ids, SMALL)
+    await _create(client, "Details Large", reference_ids, LARGE)
+
+    counts = []
+    for slug, size in (("details-small", SMALL), ("details-large", LARGE)):
+        statements.clear()
+        response = await client.get("http://test/api/v1/destinations", params={"destination_slug": slug})
+        counts.append(len(statements))
+        assert response.status_code == 200, response.text
+        assert len(response.json()["data"]["attractions"]) == size
+
+    assert counts[0] == counts[1]
+    assert raise_loads == []
+
+
+async def test_details_graph(session_factory, raise_loads, reference_ids, client):
+    """DESTINATION_DETAILS_GRAPH covers everything DestinationFullDetails renders"""
+    created = await _create(client, "Graph Large", reference_ids, LARGE)
+
+    async with session_factory() as db:
+        stmt = DestinationCRUD(db)._full_details_stmt().where(Destination.id == created["id"])
+        destination = (await db.scalars(stmt)).one()
+        details = DestinationFullDetails.model_validate(destination)
+
+    assert len(details.accommodations) == LARGE
+    assert details.accommodations[0].accommodation_type.type_ref.name == "Accommodation"
+    assert raise_loads == []
+
+
+async def test_list(client, statements, raise_loads, reference_ids):
+    for i in range(3):
+        await _create(client, f"List {i}", reference_ids, LARGE)
+
+    counts, sizes = [], []
+    for page_size in (1, 10):
+        statements.clear()
+        response = await client.get("/list", params={"page_size": page_size, "count": "none"})
+        counts.append(len(statements))
+        assert response.status_code == 200, response.text
+        sizes.append(len(response.json()["data"]))
+
+    assert sizes[0] == 1 and sizes[1] >= 3
+    assert counts[0] == counts[1]
+    assert raise_loads == []
+
+
+async def test_delete(client, statements, raise_loads, reference_ids, queued_purges):
+    small = await _create(client, "Delete Small", reference_ids, SMALL)
+    large = await _create(client, "Delete Large", reference_ids, LARGE)
+
+    counts = []
+    for created in (small, large):
+        statements.clear()
+        response = await client.delete(f"/{created['id']}")
+        counts.append(len(statements))
+        assert response.status_code == 200, response.text
+
+    assert counts[0] == counts[1]
+    assert raise_loads == []
+
+    response = await client.get("http://test/api/v1/destinations", params={"destination_slug": "delete-large"})
+    assert response.status_code == 404
+
+
+async def test_list_facets(client, statements, raise_loads, reference_ids):
+    """Facet counts and the exact total come back in the page's own statement"""
+    await _create(client, "Facets", reference_ids, SMALL)
+
+    counts = []
+    for params in ({"count": "none"}, {"count": "exact", "facets": "true"}):
+        statements.clear()
+        response = await client.get("/list", params={"page_size": 1, "fields": "name", **params})
+        counts.append(len(statements))
+        assert response.status_code == 200, response.text
+
+    meta = response.json()["meta"]
+    assert meta["total"] == sum(meta["facets"]["country"].values())
+    assert counts[0] == counts[1]
+    assert raise_loads == []
@@ -0,0 +1,38 @@
+"""
+Concurrent creates of the same name get distinct slugs, without failing a
+request and within the bounded number of INSERT attempts.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from destination.db.crud import SLUG_INSERT_ATTEMPTS
+from destination.db.models import Destination
+
+from tests.factories import destination_payload
+
+pytestmark = pytest.mark.anyio
+
+CONCURRENT_CREATES = 8
+
+
+async def test_concurrent_same_name(client, session_factory, statements, reference_ids):
+    payload = destination_payload("Same Name", reference_ids)
+
+    responses = await asyncio.gather(*(
+        client.post("/create", json=payload) for _ in range(CONCURRENT_CREATES)
+    ))
+
+    assert [response.status_code for response in responses] == [200] * CONCURRENT_CREATES, [
+        response.text for response in responses if response.status_code != 200
+    ]
+
+    async with session_factory() as db:
+        slugs = set(await db.scalars(
+            select(Destination.slug).where(Destination.id.in_([response.json()["data"]["id"] for response in responses]))
+        ))
+    assert slugs == {"same-name", *(f"same-name-{n}" for n in range(1, CONCURRENT_CREATES))}
+
+    inserts = [statement for statement in statements if statement.startswith("INSERT INTO destinations ")]
+    assert CONCURRENT_CREATES <= len(inserts) <= CONCURRENT_CREATES * SLUG_INSERT_ATTEMPTS
@@ -0,0 +1,66 @@
+"""
+PATCH never clears the accommodation type of accommodations it was not sent.
+"""
+import pytest
+
+from tests.factories import destination_payload
+
+pytestmark = pytest.mark.anyio
+
+
+def _accommodation_type(reference_ids: dict, **item) -> dict:
+    return {
+        "accommodation_type_id": reference_ids["accommodation"],
+        "price_range": "$$$",
+        "availability": "Seasonal",
+        "description": None,
+        **item,
+    }
+
+
+async def _details(client) -> dict:
+    response = await client.get("http://test/api/v1/destinations", params={"destination_slug": "patch-types"})
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def _type_ids(details: dict) -> tuple:
+    """ids of the accommodation types, and of the type of every accommodation"""
+    return (
+        [item["id"] for item in details["accommodation_types"]],
+        [item["accommodation_type"]["id"] for item in details["accommodations"]],
+    )
+
+
+async def test_replace_used_accommodation_type(client, reference_ids):
+    response = await client.post("/create", json=destination_payload("Patch Types", reference_ids, 2))
+    assert response.status_code == 200, response.text
+    created = response.json()["data"]
+    [stored_type] = (await _details(client))["accommodation_types"]
+
+    # without its id the type is a new row, and the stored one would be deleted
+    response = await client.patch(f"/{created['id']}", json={
+        "accommodation_types": [_accommodation_type(reference_ids)],
+    })
+    assert response.status_code == 409, response.text
+    assert response.json()["details"]["accommodation_type_ids"] == [stored_type["id"]]
+
+    # nothing was written
+    assert _type_ids(await _details(client)) == ([stored_type["id"]], [stored_type["id"]] * 2)
+
+    # editing the stored row keeps its accommodations attached
+    response = await client.patch(f"/{created['id']}", json={
+        "accommodation_types": [_accommodation_type(reference_ids, id=stored_type["id"])],
+    })
+    assert response.status_code == 200, response.text
+    assert _type_ids(await _details(client)) == ([stored_type["id"]], [stored_type["id"]] * 2)
+
+    # replacing it together with the accommodations remaps them
+    response = await client.patch(f"/{created['id']}", json={
+        "accommodation_types": [_accommodation_type(reference_ids)],
+        "accommodations": destination_payload("Patch Types", reference_ids, 1)["accommodations"],
+    })
+    assert response.status_code == 200, response.text
+    [new_type], accommodation_types = _type_ids(await _details(client))
+    assert new_type != stored_type["id"]
+    assert accommodation_types == [new_type]